@@ -1,6 +1,22 @@
+import os
+import sys
 from Apriori import CApriori
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from transactionStore import TransactionStore
+
+def is_spmf_file(file_path):
+    with open(file_path, "r") as file:
+        for line in file:
+            line = line.strip()
+            if line and not line.startswith(("#", "%", "@")):
+                return line.count(":") == 2
+    return False
+
 def load_data_from_txt(file_path):
+    if is_spmf_file(file_path):
+        # SPMF utility datasets are read through the shared store; Apriori rescans them, so materialize once
+        return list(TransactionStore.from_file(file_path).itemsets())
     with open(file_path, "r") as file:
         data = [line.strip().split(",") for line in file]
     return data
@@ -0,0 +1,256 @@
+"""Reproducible benchmark of the GA, HUI-Miner and Apriori on the bundled datasets.
+
+Every run happens in a fresh process with a fixed seed and records wall time,
+peak memory and the algorithm's work counter (fitness evaluations, joins or
+support counts); each case keeps the fastest of REPEATS runs. GA runs also record recall against HUI-Miner's exact result
+for the same dataset and threshold. The full mushroom and chess runs have no
+HUIs at their threshold, so prefixes of their first transactions are also run
+at thresholds with a small, non-empty exact result.
+
+    python Benchmark/benchmark.py                                  # writes Benchmark/results.json
+    python Benchmark/benchmark.py --compare Benchmark/baseline.json
+    python Benchmark/benchmark.py --output Benchmark/baseline.json # refresh the baseline
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing as cpu
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+import psutil
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (dataset, leading transactions or None for all, minimum utilities) for the GA and HUI-Miner,
+# (dataset, leading transactions, minimum supports) for Apriori
+UTILITY_GRID = [
+    ("Dataset/test.txt", None, [25, 30, 35, 40]),
+    ("Dataset/mushroom.txt", None, [1000000]),
+    ("Dataset/mushroom.txt", 100, [11417]),
+    ("Dataset/mushroom.txt", 300, [36947]),
+    ("Dataset/chess.txt", None, [1000000]),
+    ("Dataset/chess.txt", 100, [41063]),
+]
+SUPPORT_GRID = [
+    ("Dataset/test.txt", None, [0.3, 0.5]),
+]
+GA_PARAMETERS = {"population_size": 30, "generations": 20, "crossover_prob": 0.8, "mutation_prob": 0.2}
+SEED = 1
+# Each case runs this many times and keeps its fastest run, to damp scheduling noise
+REPEATS = 3
+
+# A run regresses when it is this much slower or larger than the baseline;
+# differences below the floors are treated as noise.
+TIME_TOLERANCE = 0.25
+TIME_FLOOR = 0.1
+MEMORY_TOLERANCE = 0.25
+MEMORY_FLOOR = 5.0
+
+
+def peak_memory_mb():
+    """Peak resident set size of the current process."""
+    try:
+        import resource
+    except ImportError:
+        return psutil.Process().memory_info().peak_wset / 1024 / 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def read_itemsets(path):
+    """Itemsets of a `items #UTIL: utility` result file, as sorted item lists."""
+    itemsets = []
+    with open(path) as file:
+        for line in file:
+            if "#UTIL:" in line:
+                itemsets.append(sorted(int(item) for item in line.split("#UTIL:")[0].split()))
+    return itemsets
+
+
+def write_prefix(dataset, transactions, path):
+    """Write the first transactions lines of dataset to path."""
+    with open(dataset) as source, open(path, "w") as target:
+        for _, line in zip(range(transactions), source):
+            target.write(line)
+
+
+def run_ga(dataset, threshold, output):
+    from ga import GeneticAlgorithm
+
+    ga = GeneticAlgorithm(dataset, threshold, GA_PARAMETERS["population_size"], GA_PARAMETERS["generations"],
+                          GA_PARAMETERS["crossover_prob"], GA_PARAMETERS["mutation_prob"], output)
+    ga.execute()
+    return ga.evaluations, read_itemsets(output)
+
+
+def run_hui_miner(dataset, threshold, output):
+    from HUI_Miner import HUIMiner
+
+    miner = HUIMiner()
+    miner.runAlgorithm(dataset, output, threshold)
+    return miner.joinCount, read_itemsets(output)
+
+
+def run_apriori(dataset, threshold, output):
+    from Apriori import CApriori
+    from Main import load_data_from_txt
+
+    class CountingApriori(CApriori):
+        support_counts = 0
+
+        def Support_count(self, dataset, candidate):
+            self.support_counts += 1
+            return super().Support_count(dataset, candidate)
+
+    apriori = CountingApriori()
+    frequent_itemsets = apriori.Apriori(load_data_from_txt(dataset), threshold)
+    return apriori.support_counts, [sorted(itemset) for itemset, _ in frequent_itemsets]
+
+
+RUNNERS = {"ga": run_ga, "hui_miner": run_hui_miner, "apriori": run_apriori}
+# Source directory and module of each algorithm, imported before the clock starts
+MODULES = {"ga": ("GA_None_UI", "ga"), "hui_miner": ("HUI_Miner", "HUI_Miner"), "apriori": ("Apriori", "Main")}
+
+
+def run_case(algorithm, dataset, transactions, threshold, results):
+    """Run one benchmark case; executed in a child process."""
+    os.chdir(ROOT)
+    directory, module = MODULES[algorithm]
+    sys.path.insert(0, os.path.join(ROOT, directory))
+    __import__(module)
+    random.seed(SEED)
+    with tempfile.TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(io.StringIO()):
+        if transactions is not None:
+            prefix = os.path.join(temp_dir, os.path.basename(dataset))
+            write_prefix(dataset, transactions, prefix)
+            dataset = prefix
+        start_time = time.perf_counter()
+        work, itemsets = RUNNERS[algorithm](dataset, threshold, os.path.join(temp_dir, "output.txt"))
+        wall_time = time.perf_counter() - start_time
+    results.put((wall_time, peak_memory_mb(), work, itemsets))
+
+
+def measure(algorithm, dataset, transactions, threshold):
+    context = cpu.get_context("spawn")
+    runs = []
+    for _ in range(REPEATS):
+        results = context.Queue()
+        process = context.Process(target=run_case, args=(algorithm, dataset, transactions, threshold, results))
+        process.start()
+        runs.append(results.get())
+        process.join()
+    return min(runs, key=lambda run: run[0])
+
+
+def recall(found, exact):
+    exact = {tuple(itemset) for itemset in exact}
+    if not exact:
+        return 1.0
+    return len(exact & {tuple(itemset) for itemset in found}) / len(exact)
+
+
+def run_benchmark():
+    records = []
+    for dataset, transactions, thresholds in UTILITY_GRID:
+        for threshold in thresholds:
+            exact = None
+            for algorithm in ("hui_miner", "ga"):
+                wall_time, peak_memory, work, itemsets = measure(algorithm, dataset, transactions, threshold)
+                record = {
+                    "algorithm": algorithm, "dataset": dataset, "transactions": transactions, "threshold": threshold,
+                    "wall_time": round(wall_time, 4), "peak_memory_mb": round(peak_memory, 1),
+                    "work": work, "itemsets": len(itemsets),
+                }
+                if algorithm == "hui_miner":
+                    exact = itemsets
+                else:
+                    record["recall"] = round(recall(itemsets, exact), 4)
+                records.append(record)
+                print(format_record(record))
+    for dataset, transactions, thresholds in SUPPORT_GRID:
+        for threshold in thresholds:
+            wall_time, peak_memory, work, itemsets = measure("apriori", dataset, transactions, threshold)
+            record = {
+                "algorithm": "apriori", "dataset": dataset, "transactions": transactions, "threshold": threshold,
+                "wall_time": round(wall_time, 4), "peak_memory_mb": round(peak_memory, 1),
+                "work": work, "itemsets": len(itemsets),
+            }
+            records.append(record)
+            print(format_record(record))
+    return records
+
+
+def dataset_name(record):
+    """Dataset file name, with the number of leading transactions for a prefix run."""
+    name = os.path.basename(record["dataset"])
+    return name if record.get("transactions") is None else f"{name}[:{record['transactions']}]"
+
+
+def format_record(record):
+    line = (f"{record['algorithm']:<10} {dataset_name(record):<18} {record['threshold']:>10} "
+            f"{record['wall_time']:>9.3f} s {record['peak_memory_mb']:>8.1f} MB work={record['work']} itemsets={record['itemsets']}")
+    if "recall" in record:
+        line += f" recall={record['recall']:.3f}"
+    return line
+
+
+def record_key(record):
+    return record["algorithm"], record["dataset"], record.get("transactions"), record["threshold"]
+
+
+def compare(records, baseline_records):
+    """Regressions of records against a baseline, as readable lines."""
+    baseline = {record_key(record): record for record in baseline_records}
+    regressions = []
+    for record in records:
+        base = baseline.get(record_key(record))
+        if base is None:
+            continue
+        name = f"{record['algorithm']} {dataset_name(record)} {record['threshold']}"
+        if record["wall_time"] - base["wall_time"] > max(TIME_FLOOR, base["wall_time"] * TIME_TOLERANCE):
+            regressions.append(f"{name}: wall time {base['wall_time']:.3f} s -> {record['wall_time']:.3f} s")
+        if record["peak_memory_mb"] - base["peak_memory_mb"] > max(MEMORY_FLOOR, base["peak_memory_mb"] * MEMORY_TOLERANCE):
+            regressions.append(f"{name}: peak memory {base['peak_memory_mb']:.1f} MB -> {record['peak_memory_mb']:.1f} MB")
+        if record["algorithm"] != "ga" and record["itemsets"] != base["itemsets"]:
+            regressions.append(f"{name}: exact result changed from {base['itemsets']} to {record['itemsets']} itemsets")
+        if record.get("recall", 1.0) < base.get("recall", 1.0):
+            regressions.append(f"{name}: recall {base['recall']:.3f} -> {record['recall']:.3f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=os.path.join(ROOT, "Benchmark", "results.json"))
+    parser.add_argument("--compare", help="baseline results file to check for regressions")
+    args = parser.parse_args()
+
+    results = {
+        "environment": {"python": platform.python_version(), "platform": platform.platform(), "cpus": cpu.cpu_count()},
+        "ga_parameters": GA_PARAMETERS,
+        "seed": SEED,
+        "repeats": REPEATS,
+        "records": run_benchmark(),
+    }
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+        file.write("\n")
+    print(f"* Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results["records"], baseline["records"])
+        for regression in regressions:
+            print(f"\t> Regression: {regression}")
+        print(f"* {len(regressions)} regressions against {args.compare}")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
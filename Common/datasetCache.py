@@ -0,0 +1,155 @@
+"""Binary sidecar cache for SPMF utility datasets (``items:TU:utilities`` lines).
+
+The first load of ``Dataset/x.txt`` parses the text once and writes
+``Dataset/x.txt.huic`` holding CSR-style arrays. Later loads memory-map those
+arrays instead of parsing. The sidecar records the source size, mtime and
+SHA-1 so that stale caches are rebuilt.
+
+Run ``python Common/datasetCache.py Dataset/*.txt`` to convert files up front.
+"""
+import hashlib
+import os
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"HUIC"
+VERSION = 1
+# magic, version, source size, source mtime (ns), source sha1, transactions, entries
+HEADER = struct.Struct("<4sIQq20sQQ")
+HEADER_SIZE = (HEADER.size + 7) // 8 * 8
+SIDECAR_SUFFIX = ".huic"
+
+
+class CachedDataset:
+    """CSR arrays of a dataset: row ``tid`` spans ``offsets[tid]:offsets[tid + 1]``."""
+
+    def __init__(self, items, utilities, offsets, transaction_utilities):
+        self.items = items
+        self.utilities = utilities
+        self.offsets = offsets
+        self.transaction_utilities = transaction_utilities
+
+    def __len__(self):
+        return len(self.transaction_utilities)
+
+
+def sidecar_path(path):
+    return path + SIDECAR_SUFFIX
+
+
+def file_sha1(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def parse_spmf(path):
+    """Parse an SPMF utility file into CSR arrays."""
+    items = []
+    utilities = []
+    offsets = [0]
+    transaction_utilities = []
+    with open(path, "r") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith(("#", "%", "@")):
+                continue
+            split = line.split(":")
+            items.extend(int(item) for item in split[0].split())
+            utilities.extend(int(value) for value in split[2].split())
+            transaction_utilities.append(int(split[1]))
+            offsets.append(len(items))
+    return CachedDataset(
+        np.array(items, dtype=np.int32),
+        np.array(utilities, dtype=np.int64),
+        np.array(offsets, dtype=np.int64),
+        np.array(transaction_utilities, dtype=np.int64),
+    )
+
+
+def array_layout(num_transactions, num_entries):
+    """Byte offset, dtype and length of each array in the sidecar (8-byte aligned)."""
+    layout = {}
+    position = HEADER_SIZE
+    for name, dtype, length in (
+        ("offsets", np.int64, num_transactions + 1),
+        ("transaction_utilities", np.int64, num_transactions),
+        ("utilities", np.int64, num_entries),
+        ("items", np.int32, num_entries),
+    ):
+        layout[name] = (position, dtype, length)
+        position += (np.dtype(dtype).itemsize * length + 7) // 8 * 8
+    return layout
+
+
+def write_cache(path, dataset, stat, sha1):
+    """Write the sidecar atomically next to the source file."""
+    target = sidecar_path(path)
+    temp = f"{target}.{os.getpid()}.tmp"
+    layout = array_layout(len(dataset), len(dataset.items))
+    with open(temp, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, stat.st_size, stat.st_mtime_ns, sha1, len(dataset), len(dataset.items)))
+        for name, (position, dtype, _) in layout.items():
+            file.seek(position)
+            file.write(np.ascontiguousarray(getattr(dataset, name), dtype=dtype).tobytes())
+    os.replace(temp, target)
+
+
+def read_header(target):
+    with open(target, "rb") as file:
+        data = file.read(HEADER.size)
+    if len(data) < HEADER.size:
+        return None
+    header = HEADER.unpack(data)
+    if header[0] != MAGIC or header[1] != VERSION:
+        return None
+    return header
+
+
+def map_cache(target, num_transactions, num_entries):
+    arrays = {}
+    for name, (position, dtype, length) in array_layout(num_transactions, num_entries).items():
+        if length:
+            arrays[name] = np.memmap(target, dtype=dtype, mode="r", offset=position, shape=(length,))
+        else:
+            arrays[name] = np.zeros(0, dtype=dtype)
+    return CachedDataset(arrays["items"], arrays["utilities"], arrays["offsets"], arrays["transaction_utilities"])
+
+
+def load_dataset(path, use_cache=True):
+    """Load an SPMF utility dataset, through the binary sidecar when possible."""
+    if not use_cache:
+        return parse_spmf(path)
+
+    stat = os.stat(path)
+    target = sidecar_path(path)
+    header = read_header(target) if os.path.exists(target) else None
+    if header is not None and header[2] == stat.st_size:
+        _, _, _, mtime_ns, sha1, num_transactions, num_entries = header
+        if mtime_ns == stat.st_mtime_ns:
+            return map_cache(target, num_transactions, num_entries)
+        # A touched but unchanged source keeps its cache; only the hash decides.
+        if sha1 == file_sha1(path):
+            try:
+                with open(target, "r+b") as file:
+                    file.write(HEADER.pack(MAGIC, VERSION, stat.st_size, stat.st_mtime_ns, sha1, num_transactions, num_entries))
+            except OSError:
+                pass
+            return map_cache(target, num_transactions, num_entries)
+
+    dataset = parse_spmf(path)
+    try:
+        write_cache(path, dataset, stat, file_sha1(path))
+    except OSError:
+        pass
+    return dataset
+
+
+if __name__ == "__main__":
+    for dataset_path in sys.argv[1:]:
+        dataset = load_dataset(dataset_path)
+        print(f"{sidecar_path(dataset_path)}: {len(dataset)} transactions, {len(dataset.items)} entries")
@@ -0,0 +1,116 @@
+"""Peak and per-phase memory tracking for GA and HUI-Miner runs.
+
+A daemon thread samples the process RSS every few milliseconds and keeps the
+high-water mark overall and per named phase. With trace=True tracemalloc is
+also enabled: each phase then records its Python-heap peak and the run keeps
+the top allocation sites. Tracing slows allocation-heavy code noticeably, so it
+is off by default.
+"""
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+import psutil
+
+MB = 1024 * 1024
+
+
+def process_peak_rss():
+    """Lifetime peak RSS reported by the OS, or None where unavailable."""
+    try:
+        import resource
+    except ImportError:
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", None)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if psutil.MACOS else peak * 1024
+
+
+class MemoryTracker:
+    def __init__(self, interval=0.01, trace=False, top_sites=10):
+        self.interval = interval
+        self.trace = trace
+        self.top_sites = top_sites
+        self.process = psutil.Process()
+        self.peak_rss = 0
+        self.phase_peaks = {}
+        self.phase_traced_peaks = {}
+        self.top_allocations = []
+        self.current_phase = None
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._started_tracing = False
+        self._os_peak_at_start = None
+
+    def sample(self):
+        rss = self.process.memory_info().rss
+        self.peak_rss = max(self.peak_rss, rss)
+        phase = self.current_phase
+        if phase is not None:
+            self.phase_peaks[phase] = max(self.phase_peaks.get(phase, 0), rss)
+        return rss
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        """Start sampling (and tracing, if enabled)."""
+        if self._thread is not None:
+            return
+        if self.trace and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._stop_event.clear()
+        self._os_peak_at_start = process_peak_rss()
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="memory-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and collect the final peaks and allocation sites."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.sample()
+        # The OS peak covers the whole process, which may have run a GUI or earlier runs
+        # first; it only belongs to this run if it rose while the tracker was running
+        os_peak = process_peak_rss()
+        if os_peak and self._os_peak_at_start is not None and os_peak > self._os_peak_at_start:
+            self.peak_rss = max(self.peak_rss, os_peak)
+        if self.trace and tracemalloc.is_tracing():
+            statistics = tracemalloc.take_snapshot().statistics("lineno")
+            self.top_allocations = [(str(stat.traceback), stat.size, stat.count) for stat in statistics[:self.top_sites]]
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    @contextmanager
+    def phase(self, name):
+        """Attribute samples taken inside the block to phase name."""
+        previous = self.current_phase
+        self.current_phase = name
+        if self.trace and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self.sample()
+        try:
+            yield
+        finally:
+            self.sample()
+            if self.trace and tracemalloc.is_tracing():
+                self.phase_traced_peaks[name] = max(self.phase_traced_peaks.get(name, 0), tracemalloc.get_traced_memory()[1])
+            self.current_phase = previous
+
+    def summary_lines(self):
+        """Human-readable report lines, shared by console output and file headers."""
+        lines = [f"Peak memory (RSS): ~ {self.peak_rss / MB:.3f} MB"]
+        for name, peak in self.phase_peaks.items():
+            line = f"Peak memory in {name}: ~ {peak / MB:.3f} MB"
+            if name in self.phase_traced_peaks:
+                line += f" (Python heap ~ {self.phase_traced_peaks[name] / MB:.3f} MB)"
+            lines.append(line)
+        for site, size, count in self.top_allocations:
+            lines.append(f"Allocated at {site}: ~ {size / MB:.3f} MB in {count} blocks")
+        return lines
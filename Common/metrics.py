@@ -0,0 +1,109 @@
+"""Run instrumentation: counters, per-phase timers and latency histograms.
+
+A Metrics object is cheap enough for hot paths (one perf_counter pair per
+timed block) and can be exported at any point as JSON or in the Prometheus
+text exposition format.
+"""
+import bisect
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+# Latency buckets in seconds, from 10 µs to 5 s
+DEFAULT_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 1e-1, 5e-1, 1.0, 5.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value, count=1):
+        """Record value count times."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += count
+        self.count += count
+        self.sum += value * count
+
+    def snapshot(self):
+        cumulative = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            cumulative.append(("+Inf" if bound == float("inf") else bound, total))
+        return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+class Metrics:
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.counters = defaultdict(int)
+        self.timers = defaultdict(float)
+        self.timer_calls = defaultdict(int)
+        self.histograms = {}
+
+    def increment(self, name, amount=1):
+        self.counters[name] += amount
+
+    def add_time(self, name, seconds):
+        self.timers[name] += seconds
+        self.timer_calls[name] += 1
+
+    @contextmanager
+    def timer(self, name):
+        """Time a block and add it to the phase timer name.
+
+        The context manager costs a generator per use; code timed once per
+        individual calls add_time with its own perf_counter pair instead.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def observe(self, name, value, count=1):
+        if name not in self.histograms:
+            self.histograms[name] = Histogram()
+        self.histograms[name].observe(value, count)
+
+    def snapshot(self):
+        """Plain-dict view of every metric."""
+        return {
+            "counters": dict(self.counters),
+            "timers": {name: {"seconds": seconds, "calls": self.timer_calls[name]} for name, seconds in self.timers.items()},
+            "histograms": {name: histogram.snapshot() for name, histogram in self.histograms.items()},
+        }
+
+    def to_json(self):
+        return json.dumps({"namespace": self.namespace, **self.snapshot()}, indent=2)
+
+    def to_prometheus(self):
+        """Metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = f"{self.namespace}_{name}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        if self.timers:
+            metric = f"{self.namespace}_phase_seconds"
+            lines.append(f"# TYPE {metric} counter")
+            lines += [f'{metric}{{phase="{name}"}} {seconds:.9f}' for name, seconds in sorted(self.timers.items())]
+            metric = f"{self.namespace}_phase_calls_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines += [f'{metric}{{phase="{name}"}} {self.timer_calls[name]}' for name in sorted(self.timers)]
+        for name, histogram in sorted(self.histograms.items()):
+            metric = f"{self.namespace}_{name}"
+            lines.append(f"# TYPE {metric} histogram")
+            for bound, count in histogram.snapshot()["buckets"]:
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {count}')
+            lines += [f"{metric}_sum {histogram.sum:.9f}", f"{metric}_count {histogram.count}"]
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """Write the metrics to path, as Prometheus text for .prom/.txt files and JSON otherwise."""
+        with open(path, "w") as file:
+            file.write(self.to_prometheus() if path.endswith((".prom", ".txt")) else self.to_json() + "\n")
@@ -0,0 +1,91 @@
+import itertools
+from bitarray import bitarray
+
+ORDERS = (None, "utility", "itemset")
+
+
+class ResultStore:
+    """High-utility itemsets keyed by their packed chromosome bits.
+
+    Each HUI costs one bytes key of ceil(n / 8) bytes and its utility instead of
+    a tuple of n bools; duplicates are dropped on insert. Item lists are only
+    recovered, through item_ids, when results are read or written.
+    """
+
+    def __init__(self, item_ids=None):
+        self.item_ids = list(item_ids) if item_ids else []
+        self.utilities = {}
+        self.positions = None
+
+    def __len__(self):
+        return len(self.utilities)
+
+    def __contains__(self, bits):
+        return bits.tobytes() in self.utilities
+
+    def add(self, bits, utility):
+        """Insert a HUI, returning True if it is new."""
+        return self.add_packed(bits.tobytes(), utility)
+
+    def add_packed(self, key, utility):
+        if key in self.utilities:
+            return False
+        self.utilities[key] = utility
+        return True
+
+    def add_items(self, items, utility):
+        """Insert a HUI given as original item ids, returning True if it is new."""
+        if self.positions is None or len(self.positions) != len(self.item_ids):
+            self.positions = {item: pos for pos, item in enumerate(self.item_ids)}
+        bits = bitarray(len(self.item_ids))
+        bits.setall(0)
+        for item in items:
+            bits[self.positions[item]] = 1
+        return self.add(bits, utility)
+
+    def packed_items(self, start=0):
+        """(packed bits, utility) pairs from the start-th inserted on, for checkpoints and inter-process transfer."""
+        return list(itertools.islice(self.utilities.items(), start, None))
+
+    def update(self, packed_items):
+        for key, utility in packed_items:
+            self.add_packed(key, utility)
+
+    def items_of(self, key):
+        """Original item ids of a packed itemset."""
+        bits = bitarray()
+        bits.frombytes(key)
+        del bits[len(self.item_ids):]
+        return [self.item_ids[pos] for pos in bits.search(1)]
+
+    def results(self, order=None, min_utility=None):
+        """Yield (items, utility) pairs, in insertion order or sorted by utility (descending) or itemset."""
+        if order not in ORDERS:
+            raise ValueError(f"Unknown result order: {order}")
+        pairs = self.utilities.items()
+        if min_utility is not None:
+            pairs = [(key, utility) for key, utility in pairs if utility >= min_utility]
+        if order == "utility":
+            pairs = sorted(pairs, key=lambda pair: pair[1], reverse=True)
+        elif order == "itemset":
+            pairs = sorted(((self.items_of(key), utility) for key, utility in pairs), key=lambda pair: pair[0])
+            yield from pairs
+            return
+        for key, utility in pairs:
+            yield self.items_of(key), utility
+
+    def lines(self, order=None, min_utility=None):
+        """Yield result lines in the `items #UTIL: utility` format."""
+        for items, utility in self.results(order, min_utility):
+            yield f"{' '.join(map(str, items))} #UTIL: {utility}\n"
+
+    def write(self, file, order=None, min_utility=None, buffer_lines=4096):
+        """Stream the results to an open file in bulk writes of buffer_lines lines."""
+        buffer = []
+        for line in self.lines(order, min_utility):
+            buffer.append(line)
+            if len(buffer) >= buffer_lines:
+                file.write("".join(buffer))
+                buffer.clear()
+        if buffer:
+            file.write("".join(buffer))
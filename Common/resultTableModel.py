@@ -0,0 +1,156 @@
+import bisect
+
+import numpy as np
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+HEADERS = ("Itemset", "Utility")
+
+
+class ResultTableModel(QAbstractTableModel):
+    """Read-only (itemset, utility) table over a ResultStore.
+
+    Rows reference the store's packed keys, so a view only decodes and formats
+    the rows it shows. refresh() appends the HUIs added to the store since the
+    last call; sorting by item list or utility permutes row numbers rather
+    than results, and a refresh sorts only the new rows and merges them in.
+    """
+
+    def __init__(self, store=None, min_utility=None, parent=None):
+        super().__init__(parent)
+        self.store = None
+        self.min_utility = None
+        self.keys = []
+        self.utilities = np.zeros(0)
+        self.scanned = 0
+        # Display row -> index into keys, and the sort key of each display row in ascending order
+        self.order = np.zeros(0, dtype=np.int64)
+        self.sorted_values = np.zeros(0)
+        self.sort_column = 0
+        self.sort_order = Qt.SortOrder.AscendingOrder
+        self.set_store(store, min_utility)
+
+    def set_store(self, store, min_utility=None):
+        """Show store (None for an empty table), keeping HUIs of at least min_utility."""
+        self.beginResetModel()
+        self.store = store
+        self.min_utility = min_utility
+        self.keys = []
+        self.utilities = np.zeros(0)
+        self.scanned = 0
+        self.apply_sort()
+        self.endResetModel()
+        self.refresh()
+
+    def clear(self):
+        self.set_store(None)
+
+    def refresh(self):
+        """Add rows for the HUIs inserted into the store since the last refresh."""
+        if self.store is None or len(self.store) == self.scanned:
+            return
+        new_items = self.store.packed_items(self.scanned)
+        self.scanned += len(new_items)
+        new_items = [(key, utility) for key, utility in new_items if self.min_utility is None or utility >= self.min_utility]
+        if not new_items:
+            return
+        # New rows are inserted at the end first; merge_rows then moves them into place
+        first = len(self.keys)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_items) - 1)
+        self.keys.extend(key for key, _ in new_items)
+        self.utilities = np.concatenate((self.utilities, np.fromiter((utility for _, utility in new_items), dtype=np.float64, count=len(new_items))))
+        self.order = np.concatenate((self.order, np.arange(first, len(self.keys))))
+        self.endInsertRows()
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sources = [self.source_row(index.row()) for index in persistent]
+        self.order = self.order[:first]
+        self.merge_rows(first)
+        self.move_persistent(persistent, sources)
+        self.layoutChanged.emit()
+
+    def source_row(self, row):
+        """Index into keys of the row shown at row."""
+        return int(self.order[row])
+
+    def key_at(self, row):
+        return self.keys[self.source_row(row)]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            key = self.key_at(index.row())
+            if index.column() == 0:
+                return " ".join(map(str, self.store.items_of(key)))
+            return str(self.store.utilities[key])
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() == 1:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return HEADERS[section]
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sources = [self.source_row(index.row()) for index in persistent]
+        self.sort_column = column
+        self.sort_order = order
+        self.apply_sort()
+        self.move_persistent(persistent, sources)
+        self.layoutChanged.emit()
+
+    def move_persistent(self, persistent, sources):
+        """Point persistent indexes (selections, the current index) at the new rows of their results."""
+        rows = np.empty(len(self.keys), dtype=np.int64)
+        rows[self.order] = np.arange(len(self.keys))
+        self.changePersistentIndexList(persistent, [self.index(int(rows[source]), index.column()) for source, index in zip(sources, persistent)])
+
+    def sort_values(self, start):
+        """Ascending sort keys of the rows from start on: item lists, or signed utilities."""
+        if self.sort_column == 0:
+            return [tuple(self.store.items_of(key)) for key in self.keys[start:]]
+        descending = self.sort_order == Qt.SortOrder.DescendingOrder
+        return -self.utilities[start:] if descending else self.utilities[start:]
+
+    def apply_sort(self):
+        """Recompute the row permutation for the current sort column and order."""
+        self.order = np.zeros(0, dtype=np.int64)
+        self.sorted_values = [] if self.sort_column == 0 else np.zeros(0)
+        self.merge_rows(0)
+
+    def merge_rows(self, first):
+        """Sort the rows from first on and merge them into order, which covers the rows before first.
+
+        Utilities merge with searchsorted; item lists, which are unique, with bisect.
+        Descending item lists are kept ascending and shown in reverse.
+        """
+        if first == len(self.keys):
+            return
+        values = self.sort_values(first)
+        new_rows = np.arange(first, len(self.keys))
+        if self.sort_column == 1:
+            ranked = np.argsort(values, kind="stable")
+            values = values[ranked]
+            positions = np.searchsorted(self.sorted_values, values, side="right")
+            self.order = np.insert(self.order, positions, new_rows[ranked])
+            self.sorted_values = np.insert(self.sorted_values, positions, values)
+            return
+        descending = self.sort_order == Qt.SortOrder.DescendingOrder
+        ascending = self.order[::-1] if descending else self.order
+        ranked = sorted(range(len(values)), key=values.__getitem__)
+        positions = [bisect.bisect(self.sorted_values, values[i]) for i in ranked]
+        for position, i in reversed(list(zip(positions, ranked))):
+            self.sorted_values.insert(position, values[i])
+        ascending = np.insert(ascending, positions, new_rows[ranked])
+        self.order = ascending[::-1] if descending else ascending
@@ -0,0 +1,112 @@
+import numpy as np
+
+from datasetCache import load_dataset
+
+
+class TransactionStore:
+    """Array-backed transaction database shared by the GA, HUI-Miner and Apriori.
+
+    Items and utilities of every transaction live in two contiguous arrays and
+    row ``tid`` spans ``offsets[tid]:offsets[tid + 1]`` of them. Slices share
+    those arrays and only narrow the offsets, so they never copy entries.
+    """
+
+    def __init__(self, items, utilities, offsets, transaction_utilities):
+        self.items = items
+        self.utilities = utilities
+        self.offsets = offsets
+        self.transaction_utilities = transaction_utilities
+        self._vertical_index = None
+
+    @classmethod
+    def from_file(cls, path, use_cache=True):
+        """Load an SPMF utility dataset, memory-mapping its binary sidecar when possible."""
+        dataset = load_dataset(path, use_cache)
+        return cls(dataset.items, dataset.utilities, dataset.offsets, dataset.transaction_utilities)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        """Yield ``(items, transaction_utility, utilities)`` rows as Python lists."""
+        offsets = self.offsets.tolist()
+        transaction_utilities = self.transaction_utilities.tolist()
+        for tid in range(len(self)):
+            start, end = offsets[tid], offsets[tid + 1]
+            yield self.items[start:end].tolist(), transaction_utilities[tid], self.utilities[start:end].tolist()
+
+    def row(self, tid):
+        """Items and utilities of one transaction, as views."""
+        start, end = self.offsets[tid], self.offsets[tid + 1]
+        return self.items[start:end], self.utilities[start:end]
+
+    def slice(self, start, end):
+        """Zero-copy view of transactions ``start:end``."""
+        return TransactionStore(self.items, self.utilities, self.offsets[start:end + 1], self.transaction_utilities[start:end])
+
+    def entries(self):
+        """Items, utilities and offsets rebased to start at 0, covering only this store's rows."""
+        start, end = int(self.offsets[0]), int(self.offsets[-1])
+        return self.items[start:end], self.utilities[start:end], self.offsets - start
+
+    def row_lengths(self):
+        return np.diff(self.offsets)
+
+    def max_item(self):
+        items, _, _ = self.entries()
+        return int(items.max()) if len(items) else 0
+
+    def item_twu(self):
+        """Transaction-weighted utility of every item id, indexed by item."""
+        items, _, _ = self.entries()
+        weights = np.repeat(np.asarray(self.transaction_utilities, dtype=np.float64), self.row_lengths())
+        return np.rint(np.bincount(items, weights=weights, minlength=self.max_item() + 1)).astype(np.int64)
+
+    def remap(self, mapping):
+        """New store with every item replaced by ``mapping[item]``; items mapped to 0 are dropped."""
+        items, utilities, offsets = self.entries()
+        new_items = np.asarray(mapping)[items]
+        keep = new_items > 0
+        kept_before = np.concatenate(([0], np.cumsum(keep)))
+        return TransactionStore(
+            new_items[keep].astype(np.int32),
+            np.asarray(utilities)[keep],
+            kept_before[offsets].astype(np.int64),
+            np.array(self.transaction_utilities),
+        )
+
+    def vertical_index(self):
+        """Per-item tid lists (CSC layout), built on first use.
+
+        Returns ``(item_offsets, tids, utilities)``: item ``i`` occurs in
+        transactions ``tids[item_offsets[i]:item_offsets[i + 1]]`` (ascending)
+        with the matching ``utilities``.
+        """
+        if self._vertical_index is None:
+            items, utilities, _ = self.entries()
+            row_ids = np.repeat(np.arange(len(self), dtype=np.int64), self.row_lengths())
+            order = np.argsort(items, kind="stable")
+            counts = np.bincount(items, minlength=self.max_item() + 1)
+            item_offsets = np.concatenate(([0], np.cumsum(counts)))
+            self._vertical_index = (item_offsets, row_ids[order], np.asarray(utilities)[order])
+        return self._vertical_index
+
+    def itemsets(self):
+        """Sequence view yielding each transaction's items as a list, for Apriori."""
+        return ItemsetView(self)
+
+
+class ItemsetView:
+    def __init__(self, store):
+        self.store = store
+
+    def __len__(self):
+        return len(self.store)
+
+    def __getitem__(self, tid):
+        return self.store.row(tid)[0].tolist()
+
+    def __iter__(self):
+        items, _, offsets = self.store.entries()
+        for tid in range(len(self.store)):
+            yield items[offsets[tid]:offsets[tid + 1]].tolist()
@@ -0,0 +1,421 @@
+import os
+import sys
+from bitarray import bitarray
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import multiprocessing as cpu
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from transactionStore import TransactionStore
+
+class Individual:
+    def __init__(self, bits, fitness=0, origin=None, support=None):
+        self.bits = bits
+        self.fitness = fitness
+        self.origin = origin
+        # (tids, utilities) of the transactions containing the itemset, kept for delta scoring
+        self.support = support
+
+    def key(self):
+        """Hashable form of the bits, used for population membership."""
+        return self.bits.tobytes()
+
+class TransactionProcessor:
+    def __init__(self):
+        self.biggest_item = 0
+        self.item_ids = []
+        self.item_twu = {}
+
+    def load_transactions(self, input, min_utility=None):
+        """Load transactions into a TransactionStore; with min_utility, drop items whose TWU is below it."""
+        transactions = TransactionStore.from_file(input)
+        self.biggest_item = max(self.biggest_item, transactions.max_item())
+
+        items, _, _ = transactions.entries()
+        item_twu = transactions.item_twu()
+        self.item_twu = {int(item): int(item_twu[item]) for item in np.unique(items)}
+        self.item_ids = list(range(1, self.biggest_item + 1))
+        if min_utility is not None:
+            transactions = self.prune_items(transactions, min_utility)
+        return transactions
+
+    def prune_items(self, transactions, min_utility):
+        """Drop items with TWU below min_utility and remap the rest to dense ids 1..k.
+
+        No superset of such an item can be a HUI. item_ids[i] keeps the original
+        id of the remapped item i + 1.
+        """
+        self.item_ids = sorted(item for item, twu in self.item_twu.items() if twu >= min_utility)
+        mapping = np.zeros(transactions.max_item() + 1, dtype=np.int32)
+        mapping[self.item_ids] = np.arange(1, len(self.item_ids) + 1)
+        self.biggest_item = len(self.item_ids)
+        return transactions.remap(mapping)
+
+    def build_tidsets(self, transactions):
+        """Build one transaction-bitset (tidset) per item, indexed by item - 1."""
+        item_offsets, item_tids, _ = transactions.vertical_index()
+        tidsets = []
+        for item in range(1, self.biggest_item + 1):
+            mask = np.zeros(len(transactions), dtype=bool)
+            if item + 1 < len(item_offsets):
+                mask[item_tids[item_offsets[item]:item_offsets[item + 1]]] = True
+            tids = bitarray()
+            tids.frombytes(np.packbits(mask).tobytes())
+            del tids[len(transactions):]
+            tidsets.append(tids)
+        return tidsets
+
+class UtilityMatrix:
+    def __init__(self, transactions, length, sparse=False):
+        self.length = length
+        self.sparse = sparse
+        items, utilities, offsets = transactions.entries()
+        if sparse:
+            # CSC layout: the item at bit position pos occurs in transactions
+            # tids[offsets[pos]:offsets[pos + 1]] with the matching data utilities
+            item_offsets, tids, item_utilities = transactions.vertical_index()
+            offsets = np.asarray(item_offsets[1:length + 2], dtype=np.int64)
+            self.offsets = np.concatenate((offsets, np.full(length + 1 - len(offsets), offsets[-1], dtype=np.int64)))
+            self.tids = np.asarray(tids, dtype=np.int64)
+            self.data = np.asarray(item_utilities, dtype=np.int64)
+            self.num_transactions = len(transactions)
+            # pos * num_transactions + tid of every entry, ascending, to look up (item, tid) pairs in one searchsorted
+            self.keys = np.repeat(np.arange(length, dtype=np.int64), np.diff(self.offsets)) * self.num_transactions + self.tids
+        else:
+            rows = np.repeat(np.arange(len(transactions)), transactions.row_lengths())
+            self.utilities = np.zeros((len(transactions), length), dtype=np.float64)
+            self.presence = np.zeros((len(transactions), length), dtype=np.float64)
+            self.utilities[rows, items - 1] = utilities
+            self.presence[rows, items - 1] = 1
+
+class FitnessCalculator:
+    def __init__(self, transactions, Individual_bits, num_workers=None, executor=None):
+        self.transactions = transactions
+        # A batch passes one shared thread pool instead of each calculation starting its own
+        self.executor = executor
+        self.Individual_bits = Individual_bits
+        self.num_workers = self.worker_count(num_workers)
+        # selected[item] is True for the items of the individual (item = bit position + 1)
+        self.selected = np.zeros(len(Individual_bits) + 1, dtype=bool)
+        self.selected[[pos + 1 for pos in Individual_bits.search(1)]] = True
+        self.size = Individual_bits.count()
+
+    @staticmethod
+    def worker_count(num_workers=None):
+        return num_workers if num_workers else max(1, cpu.cpu_count() // 2)
+
+    def calculate(self):
+        if self.size == 0:
+            return 0
+        if self.num_workers == 1:
+            return self.process_segment(self.transactions)
+
+        if self.executor is None:
+            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+                return self.calculate_segments(executor)
+        return self.calculate_segments(self.executor)
+
+    def calculate_segments(self, executor):
+        segment_size = (len(self.transactions) + self.num_workers - 1) // self.num_workers
+        futures = []
+        for i in range(self.num_workers):
+            start = min(i * segment_size, len(self.transactions))
+            end = len(self.transactions) if i == self.num_workers - 1 else min((i + 1) * segment_size, len(self.transactions))
+            segment = self.transactions.slice(start, end)
+            futures.append(executor.submit(self.process_segment, segment))
+        return sum(future.result() for future in as_completed(futures))
+
+    def process_segment(self, segment):
+        """Sum the utility of the individual over the transactions of a segment that contain it."""
+        items, utilities, offsets = segment.entries()
+        hits = self.selected[items]
+        hit_counts = np.concatenate(([0], np.cumsum(hits)))
+        hit_utilities = np.concatenate(([0], np.cumsum(np.where(hits, utilities, 0))))
+        counts = hit_counts[offsets[1:]] - hit_counts[offsets[:-1]]
+        fitness = hit_utilities[offsets[1:]] - hit_utilities[offsets[:-1]]
+        return int(fitness[counts == self.size].sum())
+
+
+class VerticalFitnessCalculator:
+    def __init__(self, transactions, tidsets, Individual_bits):
+        self.transactions = transactions
+        self.tidsets = tidsets
+        self.Individual_bits = Individual_bits
+
+    def calculate(self):
+        items = list(self.Individual_bits.search(1))
+        if not items:
+            return 0
+
+        tids = self.tidsets[items[0]].copy()
+        for pos in items[1:]:
+            tids &= self.tidsets[pos]
+            if not tids.any():
+                return 0
+
+        supporting_tids = np.array(list(tids.search(1)), dtype=np.int64)
+        item_offsets, item_tids, item_utilities = self.transactions.vertical_index()
+        total_fitness = 0
+        for pos in items:
+            start, end = item_offsets[pos + 1], item_offsets[pos + 2]
+            positions = np.searchsorted(item_tids[start:end], supporting_tids)
+            total_fitness += int(item_utilities[start:end][positions].sum())
+        return total_fitness
+
+
+class DeltaFitnessCalculator:
+    """Incremental fitness for single-bit flips.
+
+    A support is ``(tids, utilities)``: the ascending tids of the transactions
+    that contain an itemset and the itemset's utility in each of them. The
+    fitness is ``utilities.sum()``, and flipping one bit only needs the parent's
+    support and the flipped item's tid list.
+    """
+
+    def __init__(self, transactions, tidsets=None):
+        self.transactions = transactions
+        self.item_offsets, self.item_tids, self.item_utilities = transactions.vertical_index()
+        # Per-item transaction bitsets, indexed by bit position, for intersecting the items left after a removal;
+        # shared with the vertical engine when it has built them, otherwise built on first use
+        self.tidsets = dict(enumerate(tidsets)) if tidsets else {}
+
+    def tidset(self, pos):
+        """Transaction bitset of the item at bit position pos."""
+        tids = self.tidsets.get(pos)
+        if tids is None:
+            mask = np.zeros(len(self.transactions), dtype=bool)
+            mask[self.item_column(pos)[0]] = True
+            tids = bitarray()
+            tids.frombytes(np.packbits(mask).tobytes())
+            del tids[len(self.transactions):]
+            self.tidsets[pos] = tids
+        return tids
+
+    def item_column(self, pos):
+        """Tids and utilities of the item at bit position pos."""
+        item = pos + 1
+        if item + 1 >= len(self.item_offsets):
+            return self.item_tids[:0], self.item_utilities[:0]
+        start, end = self.item_offsets[item], self.item_offsets[item + 1]
+        return self.item_tids[start:end], self.item_utilities[start:end]
+
+    def empty_support(self):
+        return np.arange(len(self.transactions), dtype=np.int64), np.zeros(len(self.transactions), dtype=np.int64)
+
+    def support(self, Individual_bits):
+        """Support of an itemset computed from scratch, rarest item first."""
+        tids, utilities = self.empty_support()
+        for pos in sorted(Individual_bits.search(1), key=lambda pos: len(self.item_column(pos)[0])):
+            tids, utilities = self.add_item(tids, utilities, pos)
+        return tids, utilities
+
+    def add_item(self, tids, utilities, pos):
+        """Adding an item keeps the tids that also contain it and adds its utilities."""
+        item_tids, item_utilities = self.item_column(pos)
+        _, kept, matched = np.intersect1d(tids, item_tids, assume_unique=True, return_indices=True)
+        return tids[kept], utilities[kept] + item_utilities[matched]
+
+    def remove_item(self, tids, utilities, Individual_bits, pos):
+        """Removing an item widens the tids to the remaining items' intersection.
+
+        The intersection is taken over the cached item tidsets with bitwise
+        ANDs, as the vertical engine does. Tids already in the parent's support
+        just lose the item's utility; only the newly covered tids are summed
+        over the remaining items.
+        """
+        remaining = list(Individual_bits.search(1))
+        if not remaining:
+            return self.empty_support()
+        covered = self.tidset(remaining[0]).copy()
+        for other in remaining[1:]:
+            covered &= self.tidset(other)
+            if not covered.any():
+                return self.item_tids[:0], self.item_utilities[:0].astype(np.int64)
+        widened = np.flatnonzero(np.unpackbits(np.frombuffer(covered.tobytes(), dtype=np.uint8))[:len(self.transactions)])
+
+        item_tids, item_utilities = self.item_column(pos)
+        new_utilities = np.zeros(len(widened), dtype=np.int64)
+        parent_mask = np.zeros(len(self.transactions), dtype=bool)
+        parent_mask[tids] = True
+        in_parent = parent_mask[widened]
+        new_utilities[in_parent] = utilities - item_utilities[np.searchsorted(item_tids, tids)]
+        extra_tids = widened[~in_parent]
+        extra_utilities = np.zeros(len(extra_tids), dtype=np.int64)
+        for other in remaining:
+            other_tids, other_utilities = self.item_column(other)
+            extra_utilities += other_utilities[np.searchsorted(other_tids, extra_tids)]
+        new_utilities[~in_parent] = extra_utilities
+        return widened, new_utilities
+
+    def flip(self, support, Individual_bits, pos):
+        """Support of Individual_bits, which differs from the parent only at pos."""
+        tids, utilities = support
+        if Individual_bits[pos]:
+            return self.add_item(tids, utilities, pos)
+        return self.remove_item(tids, utilities, Individual_bits, pos)
+
+class BatchFitnessCalculator:
+    def __init__(self, utility_matrix, population_bits, chunk_size=64):
+        self.utility_matrix = utility_matrix
+        self.population_bits = population_bits
+        self.chunk_size = chunk_size
+
+    def to_matrix(self, population_bits):
+        """Unpack a list of bitarrays into a (candidates x items) 0/1 matrix."""
+        width = (self.utility_matrix.length + 7) // 8
+        packed = np.frombuffer(b"".join(bits.tobytes() for bits in population_bits), dtype=np.uint8)
+        packed = packed.reshape(len(population_bits), width)
+        return np.unpackbits(packed, axis=1)[:, :self.utility_matrix.length]
+
+    def calculate(self):
+        fitness = np.zeros(len(self.population_bits), dtype=np.int64)
+        for start in range(0, len(self.population_bits), self.chunk_size):
+            chunk = self.to_matrix(self.population_bits[start:start + self.chunk_size])
+            fitness[start:start + len(chunk)] = self.calculate_chunk(chunk)
+        return fitness
+
+    def calculate_rows(self, rows):
+        """Fitness of candidates already unpacked into a (candidates x items) 0/1 matrix."""
+        fitness = np.zeros(len(rows), dtype=np.int64)
+        for start in range(0, len(rows), self.chunk_size):
+            fitness[start:start + self.chunk_size] = self.calculate_chunk(rows[start:start + self.chunk_size])
+        return fitness
+
+    def calculate_chunk(self, chunk):
+        if self.utility_matrix.sparse:
+            return self.calculate_sparse(chunk)
+        return self.calculate_dense(chunk)
+
+    def calculate_dense(self, chunk):
+        chunk = chunk.T.astype(np.float64)
+        sizes = chunk.sum(axis=0)
+        counts = self.utility_matrix.presence @ chunk
+        utilities = self.utility_matrix.utilities @ chunk
+        supported = (counts == sizes) & (sizes > 0)
+        return np.rint((utilities * supported).sum(axis=0)).astype(np.int64)
+
+    def calculate_sparse(self, chunk):
+        """Fitness from the matrix's columns, touching only the rarest selected item's tids per candidate.
+
+        Only the transactions of a candidate's rarest item can support it; each
+        of those is checked against the candidate's other items with one
+        searchsorted over the sorted (item, tid) keys, so work and memory follow
+        the candidates rather than the size of the matrix.
+        """
+        matrix = self.utility_matrix
+        fitness = np.zeros(len(chunk), dtype=np.int64)
+        owners, positions = np.nonzero(chunk)
+        if not len(owners) or not len(matrix.keys):
+            return fitness
+        sizes = np.bincount(owners, minlength=len(chunk))
+        firsts = np.concatenate(([0], np.cumsum(sizes)))
+        lengths = matrix.offsets[positions + 1] - matrix.offsets[positions]
+
+        # Tids of each candidate's rarest item
+        by_length = np.lexsort((lengths, owners))
+        rarest = by_length[firsts[:-1][sizes > 0]]
+        base_lengths = lengths[rarest]
+        total = int(base_lengths.sum())
+        if not total:
+            return fitness
+        base_ends = np.cumsum(base_lengths)
+        base_index = np.arange(total) + np.repeat(matrix.offsets[positions[rarest]] - (base_ends - base_lengths), base_lengths)
+        base_tids = matrix.tids[base_index]
+        base_owners = np.repeat(owners[rarest], base_lengths)
+
+        # One (item, tid) lookup per base tid and item of its candidate
+        query_counts = sizes[base_owners]
+        query_ends = np.cumsum(query_counts)
+        query_starts = query_ends - query_counts
+        offsets_in_candidate = np.arange(int(query_ends[-1])) - np.repeat(query_starts, query_counts)
+        query_positions = positions[np.repeat(firsts[base_owners], query_counts) + offsets_in_candidate]
+        query_keys = query_positions * matrix.num_transactions + np.repeat(base_tids, query_counts)
+        found = np.minimum(np.searchsorted(matrix.keys, query_keys), len(matrix.keys) - 1)
+        hits = matrix.keys[found] == query_keys
+
+        supported = np.logical_and.reduceat(hits, query_starts)
+        utilities = np.add.reduceat(np.where(hits, matrix.data[found], 0), query_starts)
+        np.add.at(fitness, base_owners[supported], utilities[supported])
+        return fitness
+
+
+class FitnessCache:
+    # Rough per-entry cost of the OrderedDict node and the cached int
+    ENTRY_OVERHEAD = 120
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, bits):
+        return bits.tobytes()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        """Return the cached fitness for a key, or None on a miss."""
+        fitness = self.entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return fitness
+
+    def put(self, key, fitness):
+        """Store a fitness value, evicting least recently used entries over the cap."""
+        entry_size = sys.getsizeof(key) + self.ENTRY_OVERHEAD
+        if entry_size > self.max_bytes or key in self.entries:
+            return
+        self.entries[key] = fitness
+        self.size += entry_size
+        while self.size > self.max_bytes:
+            old_key, _ = self.entries.popitem(last=False)
+            self.size -= sys.getsizeof(old_key) + self.ENTRY_OVERHEAD
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class FitnessEngine:
+    def __init__(self, processor, transactions, engine="horizontal", num_workers=None):
+        self.transactions = transactions
+        self.engine = engine
+        self.num_workers = num_workers
+        self.tidsets = []
+        self.utility_matrix = None
+        if engine == "vertical":
+            self.tidsets = processor.build_tidsets(transactions)
+        elif engine in ("dense", "sparse"):
+            self.utility_matrix = UtilityMatrix(transactions, processor.biggest_item, engine == "sparse")
+
+    def calculate(self, Individual_bits):
+        """Calculate the fitness of one individual."""
+        if self.utility_matrix is not None:
+            return self.calculate_batch([Individual_bits])[0]
+        if self.engine == "vertical":
+            return VerticalFitnessCalculator(self.transactions, self.tidsets, Individual_bits).calculate()
+        return FitnessCalculator(self.transactions, Individual_bits, self.num_workers).calculate()
+
+    def calculate_batch(self, population_bits):
+        """Calculate the fitness of a batch of individuals."""
+        if self.engine == "horizontal":
+            workers = FitnessCalculator.worker_count(self.num_workers)
+            if workers == 1 or len(population_bits) < 2:
+                return [self.calculate(bits) for bits in population_bits]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return [FitnessCalculator(self.transactions, bits, workers, executor).calculate() for bits in population_bits]
+        if self.utility_matrix is None:
+            return [self.calculate(bits) for bits in population_bits]
+        calculator = BatchFitnessCalculator(self.utility_matrix, population_bits)
+        return [int(fitness) for fitness in calculator.calculate()]
+
+    def calculate_rows(self, rows):
+        """Calculate the fitness of a batch given as a (candidates x items) 0/1 matrix (dense/sparse engines)."""
+        return BatchFitnessCalculator(self.utility_matrix, None).calculate_rows(rows)
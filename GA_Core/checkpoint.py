@@ -0,0 +1,80 @@
+import os
+import pickle
+import random
+import sys
+from bitarray import bitarray
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from baseClass import Individual
+from resultStore import ResultStore
+
+CHECKPOINT_VERSION = 1
+
+
+def unpack_bits(packed, length):
+    bits = bitarray()
+    bits.frombytes(packed)
+    del bits[length:]
+    return bits
+
+
+def save_checkpoint(ga, path):
+    """Write the evolving state of a GeneticAlgorithm atomically to path.
+
+    Bits are stored packed, 8 items per byte, so a checkpoint costs about as
+    much as one pass over the population and the HUI set.
+    """
+    selector = ga.operator_selector
+    state = {
+        "version": CHECKPOINT_VERSION,
+        "dataset_path": ga.dataset_path,
+        "min_utility": ga.min_utility,
+        "biggest_item": ga.biggest_item,
+        "population": [(individual.bits.tobytes(), individual.fitness) for individual in ga.population],
+        "hui_sets": ga.hui_sets.packed_items(),
+        "generations_run": ga.generations_run,
+        "stagnant_generations": ga.stagnant_generations,
+        "evaluations": ga.evaluations,
+        "total_time": ga.total_time,
+        "random_state": random.getstate(),
+        "operator_selector": {
+            "quality": selector.quality,
+            "probabilities": selector.probabilities,
+            "total_evaluations": selector.total_evaluations,
+            "total_rewards": selector.total_rewards,
+        },
+    }
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "wb") as file:
+        pickle.dump(state, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp, path)
+
+
+def load_checkpoint(path):
+    with open(path, "rb") as file:
+        state = pickle.load(file)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {state.get('version')}")
+    return state
+
+
+def restore_checkpoint(ga, state):
+    """Put a loaded checkpoint back into a GeneticAlgorithm whose transactions are loaded."""
+    if state["dataset_path"] != ga.dataset_path or state["min_utility"] != ga.min_utility:
+        raise ValueError("Checkpoint was written for a different dataset or minimum utility")
+    if state["biggest_item"] != ga.biggest_item:
+        raise ValueError("Checkpoint item count does not match the loaded dataset")
+
+    length = ga.biggest_item
+    ga.population = [Individual(unpack_bits(packed, length), fitness) for packed, fitness in state["population"]]
+    ga.population_index = {individual.key() for individual in ga.population}
+    ga.offspring_index.clear()
+    ga.hui_sets = ResultStore(ga.item_ids)
+    ga.hui_sets.update(state["hui_sets"])
+    ga.generations_run = state["generations_run"]
+    ga.stagnant_generations = state["stagnant_generations"]
+    ga.evaluations = state["evaluations"]
+    ga.total_time = state["total_time"]
+    for name, values in state["operator_selector"].items():
+        getattr(ga.operator_selector, name).update(values)
+    random.setstate(state["random_state"])
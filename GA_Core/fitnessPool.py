@@ -0,0 +1,57 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing as cpu
+from bitarray import bitarray
+
+from baseClass import TransactionProcessor, FitnessEngine
+
+# Engine of the current worker process. With the fork start method it is
+# inherited from the parent, otherwise each worker loads the database once.
+_engine = None
+
+
+def init_worker(dataset_path, engine, min_utility):
+    global _engine
+    if _engine is None:
+        processor = TransactionProcessor()
+        transactions = processor.load_transactions(dataset_path, min_utility)
+        _engine = FitnessEngine(processor, transactions, engine, num_workers=1)
+
+
+def score_batch(packed_population, length):
+    """Score a batch of individuals sent as packed bytes."""
+    population_bits = []
+    for packed in packed_population:
+        bits = bitarray()
+        bits.frombytes(packed)
+        del bits[length:]
+        population_bits.append(bits)
+    return _engine.calculate_batch(population_bits)
+
+
+class FitnessPool:
+    def __init__(self, dataset_path, engine, fitness_engine, num_workers=None, min_utility=None):
+        global _engine
+        self.num_workers = num_workers if num_workers else cpu.cpu_count()
+        _engine = fitness_engine
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=init_worker,
+            initargs=(dataset_path, engine, min_utility),
+        )
+
+    def calculate(self, population_bits):
+        """Score a batch of individuals, split evenly across the worker processes."""
+        if not population_bits:
+            return []
+        length = len(population_bits[0])
+        packed_population = [bits.tobytes() for bits in population_bits]
+        chunk_size = (len(packed_population) + self.num_workers - 1) // self.num_workers
+        chunks = [packed_population[i:i + chunk_size] for i in range(0, len(packed_population), chunk_size)]
+
+        results = []
+        for chunk_results in self.executor.map(score_batch, chunks, [length] * len(chunks)):
+            results.extend(chunk_results)
+        return results
+
+    def shutdown(self):
+        self.executor.shutdown()
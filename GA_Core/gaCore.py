@@ -0,0 +1,891 @@
+import os
+import sys
+import random
+import time
+import itertools
+import numpy as np
+from bitarray import bitarray
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from baseClass import Individual, TransactionProcessor, FitnessEngine, FitnessCache, DeltaFitnessCalculator
+from fitnessPool import FitnessPool
+from operatorSelector import AdaptiveOperatorSelector
+from selection import SelectionTable, ArraySelection
+from maskCrossover import MaskCrossover
+from packedPopulation import PackedPopulation, pack_rows
+from transactionSampler import TransactionSampler
+from upperBoundScreen import UpperBoundScreen
+from checkpoint import save_checkpoint, load_checkpoint, restore_checkpoint
+from metrics import Metrics
+from memoryTracker import MemoryTracker
+from resultStore import ResultStore, ORDERS
+
+class GeneticAlgorithmCore:
+    """Headless genetic algorithm engine.
+
+    Progress is reported through on_event(event, details), called with one of
+    "stage" (name), "stage_done" (name, seconds), "generation" (number,
+    seconds), "resumed" (generation), "report" (dataset, lines), "error"
+    (message) and "cancelled". The console and Qt front ends adapt these to
+    print and to signals; without a callback the engine runs silently.
+    """
+
+    def __init__(self, dataset_path, min_utility, population_size, generations, crossover_prob, mutation_prob, fitness_engine="horizontal", cache_max_bytes=64 * 1024 * 1024, executor="thread", num_workers=None, prune_items=True, incremental_mutation=True, max_time=None, max_evaluations=None, stagnation_generations=None, checkpoint_path=None, checkpoint_interval=5, metrics_path=None, trace_memory=False, output_order=None, packed_population=False, init_mode="random", repair=False, screening=False, on_event=None):
+        self.dataset_path = dataset_path
+        self.population = []
+        self.population_index = set()
+        self.offspring_index = set()
+        self.population_size = population_size
+        self.generations = generations
+        self.min_utility = min_utility
+        self.mutation_prob = mutation_prob
+        self.crossover_prob = crossover_prob
+        if fitness_engine not in ("horizontal", "vertical", "dense", "sparse"):
+            raise ValueError(f"Unknown fitness engine: {fitness_engine}")
+        self.fitness_engine = fitness_engine
+        if executor not in ("thread", "process", "serial"):
+            raise ValueError(f"Unknown executor: {executor}")
+        self.executor = executor
+        self.num_workers = num_workers
+        self.prune_items = prune_items
+        self.incremental_mutation = incremental_mutation
+        if generations is None and max_time is None and max_evaluations is None and stagnation_generations is None:
+            raise ValueError("Without a generation limit a time, evaluation or stagnation limit is required")
+        # Stopping criteria besides the generation count: wall-clock seconds since
+        # the run started, fitness evaluations, and generations without a new HUI
+        self.max_time = max_time
+        self.max_evaluations = max_evaluations
+        self.stagnation_generations = stagnation_generations
+        self.run_start = None
+        self.evaluations = 0
+        self.generations_run = 0
+        self.stagnant_generations = 0
+        # Set when a generation adds no offspring, or none that needed a fresh evaluation:
+        # the itemsets the population can reach have all been seen
+        self.exhausted = False
+        self.stop_reason = None
+        # With a checkpoint path the evolving state is saved every checkpoint_interval generations
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        # Per-phase timers and counters, exported to metrics_path at the end of the run
+        self.metrics = Metrics("ga")
+        self.metrics_path = metrics_path
+        # Samples RSS per phase; trace_memory adds tracemalloc heap peaks and allocation sites
+        self.memory_tracker = MemoryTracker(trace=trace_memory)
+        # Pruning can leave fewer distinct itemsets than the population needs,
+        # so filling loops give up after this many attempts without progress.
+        self.max_stalled_attempts = 10 * population_size
+
+        self.hui_sets = ResultStore()
+        if output_order not in ORDERS:
+            raise ValueError(f"Unknown output order: {output_order}")
+        self.output_order = output_order
+        # With packed_population the population lives in one uint64 bit matrix between
+        # generations and is bred, deduplicated, scored and sorted in bulk; the
+        # Individual list is only rebuilt for checkpoints, migration and the end of a run
+        self.use_packed_population = packed_population
+        self.packed_population = None
+        # "transactions" seeds the initial population from subsets of real transactions drawn
+        # by transaction utility; repair projects unsupported children onto a transaction
+        if init_mode not in ("random", "transactions"):
+            raise ValueError(f"Unknown initialization mode: {init_mode}")
+        self.init_mode = init_mode
+        self.repair_children = repair
+        self.sampler = None
+        # With screening, TWU, support and pairwise co-occurrence bounds score candidates
+        # that cannot be HUIs as 0 without an exact evaluation
+        self.screening = screening
+        self.screen = None
+        self.biggest_item = 0
+        self.item_ids = []
+        self.avg_len = 0
+        self.transactions = []
+        self.evaluator = None
+        self.fitness_pool = None
+        self.delta_evaluator = None
+        self.fitness_cache = FitnessCache(cache_max_bytes)
+        self.processor = TransactionProcessor()
+        self.total_time = 0
+        self.crossover_operators = {
+            "single_point": self.single_point_crossover,
+            "multi_point": self.multi_point_crossover,
+            "uniform": self.uniform_crossover,
+        }
+        self.operator_selector = AdaptiveOperatorSelector(self.crossover_operators)
+        self.selection_table = None
+        self.mask_crossover = None
+        self.on_event = on_event
+        self.cancel_requested = False
+
+    def notify(self, event, **details):
+        """Pass a progress event to the on_event callback, if any."""
+        if self.on_event is not None:
+            self.on_event(event, details)
+
+    def load_transactions(self):
+        """Load transactions from the dataset."""
+        self.notify("stage", name="load")
+        start_time = time.time()
+        try:
+            if self.cancel_requested:
+                self.cancel_progress()
+                return
+            self.transactions = self.processor.load_transactions(self.dataset_path, self.min_utility if self.prune_items else None)
+            self.biggest_item = self.processor.biggest_item
+            self.item_ids = self.processor.item_ids
+            self.hui_sets = ResultStore(self.item_ids)
+            self.mask_crossover = MaskCrossover(self.biggest_item, self.population_size)
+            self.avg_len = max(1, int(self.transactions.row_lengths().mean())) if len(self.transactions) else 0
+            if self.init_mode == "transactions" or self.repair_children:
+                self.sampler = TransactionSampler(self.transactions, self.biggest_item)
+            if self.screening:
+                self.screen = UpperBoundScreen(self.transactions, self.biggest_item, self.min_utility)
+            engine_workers = self.num_workers if self.executor == "thread" else 1
+            self.evaluator = FitnessEngine(self.processor, self.transactions, self.fitness_engine, engine_workers)
+            if self.executor == "process":
+                self.fitness_pool = FitnessPool(self.dataset_path, self.fitness_engine, self.evaluator, self.num_workers,
+                                                self.min_utility if self.prune_items else None)
+            if self.incremental_mutation:
+                self.delta_evaluator = DeltaFitnessCalculator(self.transactions, self.evaluator.tidsets)
+            total_time = time.time() - start_time
+            self.metrics.add_time("load", total_time)
+            self.notify("stage_done", name="load", seconds=total_time)
+            self.total_time += total_time
+        except Exception as e:
+            self.notify("error", message=f"Error occurred while loading transactions: {e}")
+
+    def fitness_batch(self, population_bits):
+        """Calculate the fitness of a batch of individuals, serving repeats from the cache."""
+        results = [None] * len(population_bits)
+        missing = {}
+        for i, bits in enumerate(population_bits):
+            key = self.fitness_cache.key(bits)
+            fitness = self.fitness_cache.get(key)
+            if fitness is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                results[i] = fitness
+
+        for key, indexes in list(missing.items()):
+            score = self.screened_fitness(population_bits[indexes[0]])
+            if score is not None:
+                self.fitness_cache.put(key, score)
+                for i in missing.pop(key):
+                    results[i] = score
+
+        if missing:
+            computed = self.compute_fitness([population_bits[indexes[0]] for indexes in missing.values()])
+            for (key, indexes), fitness in zip(missing.items(), computed):
+                self.fitness_cache.put(key, fitness)
+                for i in indexes:
+                    results[i] = fitness
+        return results
+
+    def screened_fitness(self, Individual_bits):
+        """Bound-derived score of a candidate the screen rules out, or None if it needs an exact evaluation."""
+        if self.screen is None:
+            return None
+        start_time = time.perf_counter()
+        score = self.screen.screen(Individual_bits)
+        self.metrics.add_time("screening", time.perf_counter() - start_time)
+        self.metrics.increment("screen_checks")
+        if score is not None:
+            self.metrics.increment("screened")
+        return score
+
+    def compute_fitness(self, population_bits):
+        """Calculate the fitness of a batch of individuals in one engine or pool call."""
+        start_time = time.perf_counter()
+        try:
+            if self.fitness_pool is not None:
+                results = self.fitness_pool.calculate(population_bits)
+            else:
+                results = self.evaluator.calculate_batch(population_bits)
+        except Exception as e:
+            self.notify("error", message=f"Error occurred while calculating batch fitness: {e}")
+            results = [0] * len(population_bits)
+        self.record_fitness_time(time.perf_counter() - start_time, len(population_bits))
+        return results
+
+    def fitness_packed(self, candidates, keys):
+        """Fitness array of packed candidates, serving repeats from the cache."""
+        fitness = np.zeros(len(candidates), dtype=np.int64)
+        missing = {}
+        for i, key in enumerate(keys):
+            cached = self.fitness_cache.get(key)
+            if cached is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                fitness[i] = cached
+        if missing and self.screen is not None:
+            chromosomes = candidates.take([indexes[0] for indexes in missing.values()]).to_bitarrays()
+            for (key, indexes), bits in zip(list(missing.items()), chromosomes):
+                score = self.screened_fitness(bits)
+                if score is not None:
+                    self.fitness_cache.put(key, score)
+                    fitness[indexes] = score
+                    del missing[key]
+        if missing:
+            computed = self.compute_fitness_packed(candidates.take([indexes[0] for indexes in missing.values()]))
+            for (key, indexes), value in zip(missing.items(), computed):
+                self.fitness_cache.put(key, int(value))
+                fitness[indexes] = value
+        return fitness
+
+    def compute_fitness_packed(self, candidates):
+        """Score packed candidates straight from their rows on the matrix engines, as bitarrays otherwise."""
+        if self.fitness_pool is not None or self.evaluator.utility_matrix is None:
+            return self.compute_fitness(candidates.to_bitarrays())
+        start_time = time.perf_counter()
+        try:
+            results = self.evaluator.calculate_rows(candidates.to_matrix())
+        except Exception as e:
+            self.notify("error", message=f"Error occurred while calculating batch fitness: {e}")
+            results = np.zeros(len(candidates), dtype=np.int64)
+        self.record_fitness_time(time.perf_counter() - start_time, len(candidates))
+        return results
+
+    def record_fitness_time(self, seconds, count):
+        """Account fitness work; batch latency is spread evenly over its individuals."""
+        self.metrics.add_time("fitness", seconds)
+        self.metrics.increment("fitness_evaluations", count)
+        self.metrics.observe("fitness_latency_seconds", seconds / count, count)
+
+    def budget_spent(self, pending=0):
+        """True once the time budget is used up, or the evaluation budget would be with pending more evaluations."""
+        if self.max_time is not None and self.run_start is not None and time.time() - self.run_start >= self.max_time:
+            return True
+        return self.max_evaluations is not None and self.evaluations + pending >= self.max_evaluations
+
+    def evaluation_chunk(self, count):
+        """Batch size for scoring count individuals; a time budget splits the batch so it is checked in between."""
+        return max(1, count if self.max_time is None else self.population_size // 8)
+
+    def evaluations_left(self, count):
+        """How many of count more evaluations the evaluation budget allows."""
+        if self.max_evaluations is None:
+            return count
+        return max(0, min(count, self.max_evaluations - self.evaluations))
+
+    def evaluate(self, individuals):
+        """Score all not yet evaluated individuals in batches and record new HUIs.
+
+        Once the time or evaluation budget runs out the remaining individuals
+        are left unscored, with fitness None, for the caller to drop.
+        """
+        pending = [individual for individual in individuals if individual.fitness is None]
+        chunk = self.evaluation_chunk(len(pending))
+        for start in range(0, len(pending), chunk):
+            if start and self.budget_spent():
+                break
+            batch = pending[start:start + self.evaluations_left(chunk)]
+            if not batch:
+                break
+            self.evaluations += len(batch)
+            for individual, fitness in zip(batch, self.fitness_batch([individual.bits for individual in batch])):
+                individual.fitness = fitness
+                new_hui = individual.fitness >= self.min_utility and self.insert_hui_set(individual)
+                if individual.origin in self.crossover_operators:
+                    self.operator_selector.record(individual.origin, int(new_hui))
+
+    def evaluate_packed(self, children, keys, origins):
+        """Score packed offspring in batches and record new HUIs, returning how many were scored.
+
+        As in evaluate, a spent budget leaves the remaining rows unscored.
+        """
+        fitness = np.zeros(len(children), dtype=np.int64)
+        chunk = self.evaluation_chunk(len(children))
+        scored = 0
+        while scored < len(children):
+            if scored and self.budget_spent():
+                break
+            end = scored + self.evaluations_left(min(chunk, len(children) - scored))
+            if end == scored:
+                break
+            self.evaluations += end - scored
+            fitness[scored:end] = self.fitness_packed(children.take(np.arange(scored, end)), keys[scored:end])
+            for key, value, origin in zip(keys[scored:end], fitness[scored:end].tolist(), origins[scored:end]):
+                new_hui = value >= self.min_utility and self.hui_sets.add_packed(key, value)
+                if origin in self.crossover_operators:
+                    self.operator_selector.record(origin, int(new_hui))
+            scored = end
+        children.fitness = fitness
+        return scored
+
+    def individual_exists(self, individual_bits):
+        """Check if an individual already exists in the population or the offspring being built."""
+        key = individual_bits.tobytes()
+        return key in self.population_index or key in self.offspring_index
+
+    def add_offspring(self, individual, new_population):
+        """Add an individual to the new population unless it is a duplicate."""
+        # Called per individual, so timed with a bare perf_counter pair rather than metrics.timer
+        start_time = time.perf_counter()
+        key = individual.key()
+        added = key not in self.population_index and key not in self.offspring_index
+        if added:
+            self.offspring_index.add(key)
+            new_population.append(individual)
+        else:
+            self.metrics.increment("duplicates")
+        self.metrics.add_time("dedupe", time.perf_counter() - start_time)
+        return added
+
+    def insert_hui_set(self, individual):
+        """Insert a high-utility itemset into the result store, returning True if it is new."""
+        if individual.fitness >= self.min_utility:
+            return self.hui_sets.add(individual.bits, individual.fitness)
+        return False
+
+    def generate_initial_population(self):
+        """Generate the initial population of Individuals."""
+        self.notify("stage", name="init")
+        start_time = time.time()
+
+        try:
+            stalled = 0
+            while self.biggest_item and len(self.population) < self.population_size and stalled < self.max_stalled_attempts:
+                if self.cancel_requested or self.budget_spent(len(self.population)):
+                    break
+                
+                individual = Individual(self.initial_bits(), None)
+                if not self.individual_exists(individual.bits):
+                    self.population.append(individual)
+                    self.population_index.add(individual.key())
+                    stalled = 0
+                else:
+                    stalled += 1
+
+            self.evaluate(self.population)
+            if any(individual.fitness is None for individual in self.population):
+                self.population = [individual for individual in self.population if individual.fitness is not None]
+                self.population_index = {individual.key() for individual in self.population}
+            self.population = sorted(self.population, key=lambda x: x.fitness, reverse=True)
+        except Exception as e:
+            self.notify("error", message=f"Error occurred during initial population generation: {e}")
+
+        total_time = time.time() - start_time
+        self.metrics.add_time("init", total_time)
+        self.notify("stage_done", name="init", seconds=total_time)
+        self.total_time += total_time
+
+    def initial_bits(self):
+        """Chromosome for the initial population: a transaction subset in "transactions" mode, else random bits."""
+        if self.init_mode == "transactions":
+            Individual_bits = self.sampler.seed()
+            if Individual_bits is not None:
+                return Individual_bits
+        Individual_bits = bitarray(self.biggest_item)
+        Individual_bits.setall(0)
+
+        n = random.randint(1, self.avg_len)
+        random_positions = random.sample(range(self.biggest_item), n)
+        for pos in random_positions:
+            Individual_bits[pos] = 1
+        return Individual_bits
+
+    def repair(self, Individual_bits):
+        """Project a chromosome no transaction supports onto one that shares an item, when repair is on."""
+        if not self.repair_children:
+            return Individual_bits
+        start_time = time.perf_counter()
+        repaired = self.sampler.repair(Individual_bits)
+        self.metrics.add_time("repair", time.perf_counter() - start_time)
+        if repaired is not Individual_bits:
+            self.metrics.increment("repairs")
+        return repaired
+
+    def build_selection_table(self):
+        """Precompute ranks and alias tables for this generation's parent selection."""
+        self.selection_table = SelectionTable(self.population)
+
+    def tournament_selection(self):
+        """Select a subset of individuals and choose the best one from the subset."""
+        return self.selection_table.tournament()
+
+    def roulette_wheel_selection(self):
+        """Select an individual based on the fitness proportionate to the total fitness of the population."""
+        return self.selection_table.roulette_wheel()
+
+    def rank_selection(self):
+        """Select an individual based on its rank in the sorted population."""
+        return self.selection_table.rank()
+
+    def single_point_crossover(self, parent_1, parent_2):
+        """Perform single_point crossover between two parents."""
+        s = random.randint(1, self.biggest_item // 2)
+        e = random.randint(s + 1, max(s + 1, self.biggest_item - 1))
+        child_1_bits = parent_1.bits[:s] + parent_2.bits[s:e] + parent_1.bits[e:]
+        child_2_bits = parent_2.bits[:s] + parent_1.bits[s:e] + parent_2.bits[e:]
+        child_1 = Individual(child_1_bits, None)
+        child_2 = Individual(child_2_bits, None)
+        return child_1, child_2
+
+    def multi_point_crossover(self, parent_1, parent_2):
+        """Perform multi-point crossover between two parents with random."""
+        child_1_bits, child_2_bits = self.mask_crossover.cross(parent_1.bits, parent_2.bits, "multi_point")
+        child_1 = Individual(child_1_bits, None)
+        child_2 = Individual(child_2_bits, None)
+        
+        return child_1, child_2
+
+    def uniform_crossover(self, parent_1, parent_2):
+        """Perform uniform crossover between two parents."""
+        child_1_bits, child_2_bits = self.mask_crossover.cross(parent_1.bits, parent_2.bits, "uniform")
+        child_1 = Individual(child_1_bits, None)
+        child_2 = Individual(child_2_bits, None)
+        return child_1, child_2
+
+    def crossover(self, parent_1, parent_2):
+        """Perform crossover with the operator picked by the adaptive selector."""
+        name = self.operator_selector.select()
+        start_time = time.perf_counter()
+        child_1, child_2 = self.crossover_operators[name](parent_1, parent_2)
+        self.metrics.add_time("crossover", time.perf_counter() - start_time)
+        self.metrics.increment("crossovers")
+        child_1.bits = self.repair(child_1.bits)
+        child_2.bits = self.repair(child_2.bits)
+        child_1.origin = name
+        child_2.origin = name
+        return child_1, child_2
+
+    def mutate(self, individual):
+        """Mutate a copy of an individual.
+
+        A scored parent hands down its support so a new mutant is scored
+        incrementally; otherwise, and for mutants that duplicate an individual
+        or are already cached, the mutant is left to add_offspring and its
+        generation's batch.
+        """
+        start_time = time.perf_counter()
+        bits = individual.bits.copy()
+        bit_pos = random.randint(0, len(bits) - 1)
+        bits[bit_pos] = not bits[bit_pos]
+        self.metrics.add_time("mutation", time.perf_counter() - start_time)
+        self.metrics.increment("mutations")
+        repaired = self.repair(bits)
+        if repaired is not bits or self.delta_evaluator is None or individual.fitness is None or not self.evaluations_left(1):
+            return Individual(repaired, None)
+        key = self.fitness_cache.key(bits)
+        if key in self.population_index or key in self.offspring_index or key in self.fitness_cache:
+            return Individual(bits, None)
+        start_time = time.perf_counter()
+        try:
+            if individual.support is None:
+                individual.support = self.delta_evaluator.support(individual.bits)
+            support = self.delta_evaluator.flip(individual.support, bits, bit_pos)
+        except Exception as e:
+            self.notify("error", message=f"Error occurred while calculating incremental fitness: {e}")
+            return Individual(bits, None)
+        fitness = int(support[1].sum())
+        self.evaluations += 1
+        self.record_fitness_time(time.perf_counter() - start_time, 1)
+        self.metrics.increment("incremental_evaluations")
+        self.fitness_cache.put(key, fitness)
+        return Individual(bits, fitness, support=support)
+
+    def handle_crossover(self, parent_1, parent_2, new_population):
+        """Add crossover offspring to the population"""
+        try:
+            child_1, child_2 = self.crossover(parent_1, parent_2)
+            
+            self.add_offspring(child_1, new_population)
+            self.add_offspring(child_2, new_population)
+        except Exception as e:
+            self.notify("error", message=f"An error occurred during crossover: {e}")
+            return
+
+    def handle_mutate(self, new_population):
+        """Add mutated offspring to the population"""
+        try:
+            num_mutations = len(new_population)//8
+            for _ in range(num_mutations):
+                mutated = self.mutate(random.choice(new_population))
+                if self.add_offspring(mutated, new_population) and mutated.fitness is not None:
+                    self.insert_hui_set(mutated)
+        except Exception as e:
+            self.notify("error", message=f"An error occurred during mutation: {e}")
+            return
+
+    def select_parents(self):
+        """Select two distinct parents from the population."""
+        start_time = time.perf_counter()
+        parent_1 = self.selection_table.select()
+        parent_2 = parent_1
+        while parent_2 == parent_1:
+            parent_2 = self.selection_table.select()
+        self.metrics.add_time("selection", time.perf_counter() - start_time)
+        return parent_1, parent_2
+
+    def handle_offspring(self, parent_1, parent_2, new_population):
+        """Handle crossover and mutation of offspring."""
+        if random.random() < self.crossover_prob:
+            self.handle_crossover(parent_1, parent_2, new_population)
+        if random.random() < self.mutation_prob:
+            self.handle_mutate(new_population)
+
+    def generate_offspring(self, new_population):
+        """Generate offspring by crossover and mutation, then score them in one batch."""
+        stalled = 0
+        # Offspring still to be scored by the batch; incrementally scored mutants are already counted
+        pending = 0
+        while len(new_population) < self.population_size and stalled < self.max_stalled_attempts:
+            if self.cancel_requested or self.budget_spent(pending):
+                break
+            size = len(new_population)
+            parent_1, parent_2 = self.select_parents()
+            self.handle_offspring(parent_1, parent_2, new_population)
+            pending += sum(individual.fitness is None for individual in new_population[size:])
+            stalled = stalled + 1 if len(new_population) == size else 0
+        self.evaluate(new_population)
+        new_population[:] = [individual for individual in new_population if individual.fitness is not None]
+        self.operator_selector.update()
+
+    def breed_packed(self, rng, selection, pool):
+        """One round of bulk crossover and mutation over the packed population.
+
+        Each pair yields two crossover children with crossover_prob and, with
+        mutation_prob, a mutant of every eighth pool row, so the round breeds
+        just enough pairs to cover the population's shortfall on average.
+        Returns the candidate rows and the operator that produced each one.
+        """
+        pairs = self.packed_pairs(len(pool))
+        with self.metrics.timer("selection"):
+            first, second = selection.select_pairs(rng, pairs)
+        batches = []
+        origins = []
+        crossed = np.flatnonzero(rng.random(pairs) < self.crossover_prob)
+        if len(crossed):
+            with self.metrics.timer("crossover"):
+                kinds = np.array([self.operator_selector.select() for _ in crossed])
+                for kind in self.crossover_operators:
+                    chosen = crossed[kinds == kind]
+                    if len(chosen):
+                        masks = pack_rows(self.mask_crossover.rows(kind, len(chosen)), self.biggest_item)
+                        batches.append(self.packed_population.crossover(first[chosen], second[chosen], masks))
+                        origins.extend([kind] * (2 * len(chosen)))
+            self.metrics.increment("crossovers", len(crossed))
+        num_mutations = int((rng.random(pairs) < self.mutation_prob).sum()) * (len(pool) // 8)
+        if num_mutations:
+            with self.metrics.timer("mutation"):
+                rows = rng.integers(len(pool), size=num_mutations)
+                batches.append(pool.mutants(rows, rng.integers(self.biggest_item, size=num_mutations)))
+                origins.extend(["mutation"] * num_mutations)
+            self.metrics.increment("mutations", num_mutations)
+        candidates = PackedPopulation.empty(self.biggest_item)
+        for batch in batches:
+            candidates = candidates.concat(batch)
+        if self.repair_children:
+            candidates = PackedPopulation.from_bitarrays([self.repair(bits) for bits in candidates.to_bitarrays()], self.biggest_item)
+        return candidates, origins
+
+    def packed_pairs(self, pool_size):
+        expected = 2 * self.crossover_prob + self.mutation_prob * (pool_size // 8)
+        return max(1, int(np.ceil((self.population_size - pool_size) / max(expected, 1.0))))
+
+    def dedupe_packed(self, candidates, order, limit):
+        """Indexes and keys of up to limit candidates, taken in order, that are new to the population and offspring."""
+        with self.metrics.timer("dedupe"):
+            fresh = []
+            keys = []
+            all_keys = candidates.keys()
+            for i in order:
+                if len(fresh) >= limit:
+                    break
+                key = all_keys[i]
+                if key in self.population_index or key in self.offspring_index:
+                    self.metrics.increment("duplicates")
+                    continue
+                self.offspring_index.add(key)
+                fresh.append(i)
+                keys.append(key)
+            return fresh, keys
+
+    def generate_packed_offspring(self, survivors):
+        """Breed packed offspring until the population is refilled, then score them in one batch.
+
+        Returns the survivors followed by the scored offspring, and the keys of all their rows.
+        """
+        rng = self.mask_crossover.rng()
+        selection = ArraySelection(self.packed_population.fitness)
+        pool = survivors
+        keys = []
+        origins = []
+        stalled = 0
+        while len(pool) < self.population_size and stalled < self.max_stalled_attempts:
+            if self.cancel_requested or self.budget_spent(len(pool) - len(survivors)):
+                break
+            candidates, candidate_origins = self.breed_packed(rng, selection, pool)
+            fresh, fresh_keys = self.dedupe_packed(candidates, rng.permutation(len(candidates)), self.population_size - len(pool))
+            stalled = 0 if fresh else stalled + self.packed_pairs(len(pool))
+            pool = pool.concat(candidates.take(fresh))
+            keys.extend(fresh_keys)
+            origins.extend(candidate_origins[i] for i in fresh)
+        children = pool.take(np.arange(len(survivors), len(pool)))
+        scored = self.evaluate_packed(children, keys, origins)
+        if scored < len(children):
+            children = children.take(np.arange(scored))
+            keys = keys[:scored]
+            pool = pool.take(np.arange(len(survivors) + scored))
+        self.operator_selector.update()
+        pool.fitness[len(survivors):] = children.fitness
+        return pool, survivors.keys() + keys
+
+    def update_packed_population(self, pool, keys):
+        """Keep the fittest rows of the packed pool, sorted best first.
+
+        When too few children survived deduplication to fill the pool, the
+        previous population's rows it lacks are kept too, as list mode keeps
+        its population, so the population never shrinks.
+        """
+        if len(pool) < self.population_size and self.packed_population is not None:
+            pooled = set(keys)
+            previous_keys = self.packed_population.keys()
+            missing = [i for i, key in enumerate(previous_keys) if key not in pooled]
+            pool = pool.concat(self.packed_population.take(np.array(missing, dtype=np.int64)))
+            keys = keys + [previous_keys[i] for i in missing]
+        order = pool.fitness_order()[:self.population_size]
+        self.packed_population = pool.take(order)
+        self.population_index = {keys[i] for i in order}
+        self.offspring_index.clear()
+
+    def evolve_packed_generation(self):
+        """Produce the next generation on the packed population matrix, returning how many offspring it added."""
+        if self.packed_population is None:
+            self.packed_population = PackedPopulation.from_individuals(self.population, self.biggest_item)
+        survivors = self.packed_population.take(np.arange(min(len(self.packed_population), self.population_size // 2)))
+        pool, keys = self.generate_packed_offspring(survivors)
+        self.update_packed_population(pool, keys)
+        return len(pool) - len(survivors)
+
+    def sync_population(self):
+        """Rebuild the Individual list from the packed population, when one is in use."""
+        if self.packed_population is not None:
+            self.population = self.packed_population.to_individuals()
+
+    def update_population(self, new_population):
+        """Update the population with new Individuals."""
+        new_population_sorted = sorted(new_population, key=lambda x: x.fitness, reverse=True)
+        if len(new_population) > self.population_size:
+            self.population = new_population_sorted[:self.population_size]
+            self.population_index = {individual.key() for individual in self.population}
+        self.offspring_index.clear()
+
+    def evolve_generation(self):
+        """Produce the next generation from the current population."""
+        huis_before = len(self.hui_sets)
+        fresh_before = self.fresh_evaluations()
+        # Masks are drawn per generation so a checkpoint between generations captures all random state
+        self.mask_crossover.reset()
+        if self.use_packed_population:
+            offspring = self.evolve_packed_generation()
+        else:
+            new_population = self.population[:self.population_size//2]
+            survivors = len(new_population)
+            self.build_selection_table()
+            self.generate_offspring(new_population)
+            offspring = len(new_population) - survivors
+            self.update_population(new_population)
+        self.exhausted = not offspring or self.fresh_evaluations() == fresh_before
+        self.generations_run += 1
+        self.stagnant_generations = 0 if len(self.hui_sets) > huis_before else self.stagnant_generations + 1
+
+    def stopping_criterion(self):
+        """Name of the stopping criterion that has fired, or None to keep evolving."""
+        if self.max_time is not None and time.time() - self.run_start >= self.max_time:
+            return "max_time"
+        if self.max_evaluations is not None and self.evaluations >= self.max_evaluations:
+            return "max_evaluations"
+        if self.stagnation_generations is not None and self.stagnant_generations >= self.stagnation_generations:
+            return "stagnation"
+        if self.exhausted:
+            return "exhausted"
+        return None
+
+    def fresh_evaluations(self):
+        """Candidates scored so far by an engine, the pool, incrementally or by the screen, not from the cache."""
+        return self.metrics.counters["fitness_evaluations"] + self.metrics.counters["screened"]
+
+    def accept_migrants(self, migrants):
+        """Replace the worst individuals with migrants from another island.
+
+        Migrants arrive as (packed bits, fitness) pairs; duplicates of resident
+        individuals are skipped.
+        """
+        self.sync_population()
+        self.packed_population = None
+        for packed, fitness in migrants:
+            bits = bitarray()
+            bits.frombytes(packed)
+            del bits[self.biggest_item:]
+            individual = Individual(bits, fitness)
+            if self.individual_exists(individual.bits):
+                continue
+            if len(self.population) >= self.population_size:
+                self.population_index.discard(self.population.pop().key())
+            self.population.append(individual)
+            self.population_index.add(individual.key())
+            self.insert_hui_set(individual)
+            self.population.sort(key=lambda x: x.fitness, reverse=True)
+
+    def emigrants(self, count):
+        """The best individuals, packed for sending to another island."""
+        self.sync_population()
+        return [(individual.bits.tobytes(), individual.fitness) for individual in self.population[:count]]
+
+    def save_checkpoint(self):
+        """Save the evolving state to checkpoint_path."""
+        try:
+            self.sync_population()
+            save_checkpoint(self, self.checkpoint_path)
+        except Exception as e:
+            self.notify("error", message=f"Error occurred while saving checkpoint: {e}")
+
+    def evolve_population(self):
+        """Evolve the population over several generations"""
+        try:
+            self.notify("stage", name="evolve")
+            if self.run_start is None:
+                self.run_start = time.time()
+            self.stop_reason = "generations"
+            if len(self.population) < 2:
+                self.stop_reason = self.stopping_criterion() or "population"
+                return
+            for generation in range(self.generations_run, self.generations) if self.generations is not None else itertools.count(self.generations_run):
+                reason = self.stopping_criterion()
+                if reason is not None:
+                    self.stop_reason = reason
+                    break
+                start_time = time.time()
+                self.evolve_generation()
+                total_time = time.time() - start_time
+                self.total_time += total_time
+                self.notify("generation", number=generation + 1, seconds=total_time)
+                if self.checkpoint_path and (self.cancel_requested or self.generations_run % self.checkpoint_interval == 0):
+                    self.save_checkpoint()
+                if self.cancel_requested:
+                    self.stop_reason = "cancelled"
+                    self.sync_population()
+                    return
+            self.sync_population()
+
+        except Exception as e:
+            self.notify("error", message=f"An error occurred during population evolution: {e}")
+            return
+
+    def performance_lines(self):
+        """Human-readable performance report lines."""
+        lines = [f"Total High-utility item-sets found: {len(self.hui_sets)}", f"Total time: ~ {self.total_time:.3f} s"]
+        lines.extend(self.memory_tracker.summary_lines())
+        lines.append(f"Fitness cache: {self.fitness_cache.hits} hits / {self.fitness_cache.misses} misses ({self.fitness_cache.hit_rate():.1%})")
+        if self.screen is not None:
+            checks = self.metrics.counters["screen_checks"]
+            screened = self.metrics.counters["screened"]
+            lines.append(f"Screening: {screened} of {checks} candidates skipped without exact evaluation ({screened / checks if checks else 0:.1%})")
+        lines.append(f"Stopped by {self.stop_reason} after {self.generations_run} generations and {self.evaluations} evaluations")
+        for phase, seconds in self.metrics.timers.items():
+            lines.append(f"Phase {phase}: ~ {seconds:.3f} s over {self.metrics.timer_calls[phase]} calls")
+        for name, (probability, evaluations, new_huis) in self.operator_selector.summary().items():
+            lines.append(f"Crossover {name}: p={probability:.2f}, {new_huis} new HUIs / {evaluations} evaluations")
+        return lines
+
+    def report_performance(self):
+        """Report performance metrics."""
+        self.memory_tracker.sample()
+        self.total_memory = self.memory_tracker.peak_rss
+        self.notify("report", dataset=os.path.splitext(os.path.basename(self.dataset_path))[0], lines=self.performance_lines())
+
+    def header_lines(self):
+        """Result file header lines."""
+        lines = [f'Genetic Algorithm Result For Database: {os.path.splitext(os.path.basename(self.dataset_path))[0]} ',
+                 f'Total time: {self.total_time:.3f} s']
+        lines.extend(self.memory_tracker.summary_lines())
+        lines.append(f"Total High-utility item-sets found: {len(self.hui_sets)}")
+        return lines
+
+    def write_header(self, file):
+        """Write header information to the file."""
+        for line in self.header_lines():
+            file.write(f"{line}\n")
+        file.write("\n")
+
+    def write_hui_sets(self, file):
+        """Write high-utility itemsets to the file."""
+        self.hui_sets.write(file, self.output_order, self.min_utility)
+
+    def save_files(self, output):
+        """Save results to an output file."""
+        with open(output, "w") as file:
+            self.write_header(file)
+            self.write_hui_sets(file)
+
+    def execute(self, output=None):
+        """Execute the genetic algorithm, saving the results to output if given."""
+        try:
+            self.run_start = time.time()
+            self.memory_tracker.start()
+            with self.memory_tracker.phase("load"):
+                self.load_transactions()
+            with self.memory_tracker.phase("init"):
+                self.generate_initial_population()
+            with self.memory_tracker.phase("evolve"):
+                self.evolve_population()
+            self.memory_tracker.stop()
+            self.cancel_progress()
+            self.report_performance()
+            if output:
+                self.save_files(output)
+        except Exception as e:
+            self.notify("error", message=f"An error occurred during the execution of the genetic algorithm: {e}")
+            return
+        finally:
+            if self.metrics_path:
+                self.export_metrics(self.metrics_path)
+            self.shutdown()
+
+    def resume(self, checkpoint_path=None, output=None):
+        """Continue a checkpointed run exactly where it left off, saving the results to output if given."""
+        try:
+            self.checkpoint_path = checkpoint_path or self.checkpoint_path
+            self.memory_tracker.start()
+            with self.memory_tracker.phase("load"):
+                self.load_transactions()
+                restore_checkpoint(self, load_checkpoint(self.checkpoint_path))
+                self.packed_population = None
+            self.run_start = time.time() - self.total_time
+            self.notify("resumed", generation=self.generations_run)
+            with self.memory_tracker.phase("evolve"):
+                self.evolve_population()
+            self.memory_tracker.stop()
+            self.cancel_progress()
+            self.report_performance()
+            if output:
+                self.save_files(output)
+        except Exception as e:
+            self.notify("error", message=f"An error occurred while resuming the genetic algorithm: {e}")
+            return
+        finally:
+            if self.metrics_path:
+                self.export_metrics(self.metrics_path)
+            self.shutdown()
+
+    def export_metrics(self, path):
+        """Write the run's metrics to path (JSON, or Prometheus text for .prom/.txt)."""
+        self.metrics.counters["cache_hits"] = self.fitness_cache.hits
+        self.metrics.counters["cache_misses"] = self.fitness_cache.misses
+        self.metrics.counters["generations"] = self.generations_run
+        try:
+            self.metrics.export(path)
+        except Exception as e:
+            self.notify("error", message=f"Error occurred while exporting metrics: {e}")
+
+    def shutdown(self):
+        """Release the fitness worker processes, if any, and stop memory sampling."""
+        self.memory_tracker.stop()
+        if self.fitness_pool is not None:
+            self.fitness_pool.shutdown()
+            self.fitness_pool = None
+
+    def cancel_progress(self):
+        if self.cancel_requested:
+            self.notify("cancelled")
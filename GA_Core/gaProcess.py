@@ -0,0 +1,137 @@
+import os
+import pickle
+import sys
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from gaCore import GeneticAlgorithmCore
+from resultStore import ResultStore
+
+
+def run_ga_process(connection, ga_args, ga_options, commands=None):
+    """Run a GA in this process, streaming its progress to connection.
+
+    Messages are ("event", event, details) for every engine event,
+    ("items", item_ids) once the dataset is loaded, ("progress", new_huis,
+    population, total_time, generations_run) after the initial population and
+    each generation, and ("finished", header_lines) at the end. HUIs and
+    individuals travel as (packed bits, utility) pairs, and only the HUIs found
+    since the previous message are sent. A "cancel" message read from the
+    commands stream, if given, cancels the run as GeneticAlgorithmCore does,
+    so it can still save a checkpoint.
+    """
+    sent = 0
+
+    def report(event, details):
+        nonlocal sent
+        connection.send(("event", event, details))
+        if event == "stage_done" and details["name"] == "load":
+            connection.send(("items", ga.item_ids))
+        elif event == "generation" or (event == "stage_done" and details["name"] == "init"):
+            new_huis = ga.hui_sets.packed_items(sent)
+            sent += len(new_huis)
+            connection.send(("progress", new_huis, ga.emigrants(ga.population_size), ga.total_time, ga.generations_run))
+
+    ga = GeneticAlgorithmCore(*ga_args, on_event=report, **ga_options)
+    if commands is not None:
+        threading.Thread(target=watch_for_cancel, args=(commands, ga), daemon=True).start()
+    try:
+        ga.execute()
+        connection.send(("progress", ga.hui_sets.packed_items(sent), ga.emigrants(ga.population_size), ga.total_time, ga.generations_run))
+        connection.send(("finished", ga.header_lines()))
+    finally:
+        connection.close()
+
+
+def watch_for_cancel(commands, ga):
+    """Request cancellation of ga once "cancel" arrives on commands; runs on a daemon thread."""
+    try:
+        while pickle.load(commands) != "cancel":
+            pass
+    except (EOFError, pickle.UnpicklingError, OSError):
+        return
+    ga.cancel_requested = True
+
+
+class StreamConnection:
+    """Send end of a message stream over a binary file, for a GA child started as a plain script."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def send(self, message):
+        pickle.dump(message, self.stream)
+        self.stream.flush()
+
+    def close(self):
+        self.stream.close()
+
+
+def main():
+    """Child entry point: read (ga_args, ga_options) from stdin and stream run_ga_process messages to stdout.
+
+    Running this file as a script keeps the child free of the launching
+    program's own modules, such as the Qt front end. stdin stays open for a
+    later "cancel" message.
+    """
+    output = sys.stdout.buffer
+    # Stray prints must not corrupt the message stream
+    sys.stdout = sys.stderr
+    # Unbuffered, so reading the arguments cannot swallow a cancel message sent right after them,
+    # and the watching daemon thread holds no buffer lock when the interpreter exits
+    commands = os.fdopen(sys.stdin.fileno(), "rb", buffering=0, closefd=False)
+    ga_args, ga_options = pickle.load(commands)
+    run_ga_process(StreamConnection(output), ga_args, ga_options, commands)
+
+
+class GAResult:
+    """The last reported state of a GA running in another process.
+
+    Holds what run_ga_process has streamed so far, so a run that is cancelled
+    or killed part way still has its population and HUIs to display and save.
+    """
+
+    def __init__(self, dataset_path, min_utility, output_order=None):
+        self.dataset_path = dataset_path
+        self.min_utility = min_utility
+        self.output_order = output_order
+        self.hui_sets = ResultStore()
+        self.population = []
+        self.total_time = 0
+        self.generations_run = 0
+        self.header = None
+
+    @property
+    def completed(self):
+        return self.header is not None
+
+    def update(self, message):
+        """Apply one non-event message from run_ga_process."""
+        kind = message[0]
+        if kind == "items":
+            self.hui_sets.item_ids = list(message[1])
+        elif kind == "progress":
+            _, new_huis, self.population, self.total_time, self.generations_run = message
+            self.hui_sets.update(new_huis)
+        elif kind == "finished":
+            self.header = message[1]
+
+    def header_lines(self):
+        if self.header is not None:
+            return self.header
+        return [f'Genetic Algorithm Result For Database: {os.path.splitext(os.path.basename(self.dataset_path))[0]} ',
+                f'Total time: {self.total_time:.3f} s',
+                f"Stopped after {self.generations_run} generations",
+                f"Total High-utility item-sets found: {len(self.hui_sets)}"]
+
+    def save_files(self, output):
+        """Save results to an output file, in the format of GeneticAlgorithmCore.save_files."""
+        with open(output, "w") as file:
+            for line in self.header_lines():
+                file.write(f"{line}\n")
+            file.write("\n")
+            self.hui_sets.write(file, self.output_order, self.min_utility)
+
+
+if __name__ == "__main__":
+    main()
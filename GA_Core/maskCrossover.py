@@ -0,0 +1,93 @@
+import random
+import numpy as np
+from bitarray import bitarray
+
+
+class MaskCrossover:
+    """Crossover through random bit masks drawn in bulk.
+
+    A mask m marks the positions a child takes from the other parent, so the
+    children are (p1 & ~m) | (p2 & m) and (p2 & ~m) | (p1 & m): a fixed number
+    of whole-word bitarray operations whatever the chromosome width. Masks are
+    drawn batch_size at a time from a NumPy generator seeded from the random
+    module, and reset() drops unused ones so runs stay reproducible from the
+    random module state alone.
+    """
+
+    def __init__(self, length, batch_size=64):
+        self.length = length
+        # Multi-point masks need a float matrix of batch_size x length while drawing
+        self.batch_size = max(1, min(batch_size, (1 << 20) // max(1, length)))
+        self.masks = {"uniform": [], "multi_point": []}
+
+    def reset(self):
+        for masks in self.masks.values():
+            masks.clear()
+
+    def rng(self):
+        return np.random.default_rng(random.getrandbits(64))
+
+    def to_bitarrays(self, rows):
+        """Bool matrix rows as bitarrays of the chromosome length."""
+        packed = np.packbits(rows, axis=1)
+        masks = []
+        for row in packed:
+            mask = bitarray()
+            mask.frombytes(row.tobytes())
+            del mask[self.length:]
+            masks.append(mask)
+        return masks
+
+    def uniform_rows(self, count):
+        """Mask rows taking each position from either parent with probability 1/2."""
+        return self.rng().random((count, self.length)) < 0.5
+
+    def multi_point_rows(self, count):
+        """Mask rows that alternate parents at length // 2 random cut points.
+
+        The last cut point never switches parents, as in the original
+        slice-concatenating operator.
+        """
+        cuts = self.length // 2
+        order = self.rng().random((count, self.length)).argsort(axis=1)[:, :cuts]
+        order.sort(axis=1)
+        toggles = np.zeros((count, self.length), dtype=np.int8)
+        np.put_along_axis(toggles, order[:, :-1], 1, axis=1)
+        return np.cumsum(toggles, axis=1) % 2 == 1
+
+    def single_point_rows(self, count):
+        """Mask rows swapping one segment [s, e), drawn like the single-point operator."""
+        if self.length < 2:
+            return np.zeros((count, self.length), dtype=bool)
+        rng = self.rng()
+        starts = rng.integers(1, self.length // 2 + 1, size=count)
+        ends = rng.integers(starts + 1, np.maximum(starts + 1, self.length - 1) + 1)
+        positions = np.arange(self.length)
+        return (positions >= starts[:, None]) & (positions < ends[:, None])
+
+    def rows(self, kind, count):
+        """count mask rows of an operator kind, drawn in chunks of batch_size."""
+        draw = {"uniform": self.uniform_rows, "multi_point": self.multi_point_rows, "single_point": self.single_point_rows}[kind]
+        chunks = [draw(min(self.batch_size, count - start)) for start in range(0, count, self.batch_size)]
+        return np.vstack(chunks) if chunks else np.zeros((0, self.length), dtype=bool)
+
+    def uniform_masks(self, count):
+        return self.to_bitarrays(self.uniform_rows(count))
+
+    def multi_point_masks(self, count):
+        return self.to_bitarrays(self.multi_point_rows(count))
+
+    def next_mask(self, kind):
+        masks = self.masks[kind]
+        if not masks:
+            draw = self.uniform_masks if kind == "uniform" else self.multi_point_masks
+            masks.extend(draw(self.batch_size))
+        return masks.pop()
+
+    def cross(self, parent_1_bits, parent_2_bits, kind):
+        """Two children of a pair of chromosomes under the next mask of the given kind."""
+        mask = self.next_mask(kind)
+        inverse = ~mask
+        child_1_bits = (parent_1_bits & inverse) | (parent_2_bits & mask)
+        child_2_bits = (parent_2_bits & inverse) | (parent_1_bits & mask)
+        return child_1_bits, child_2_bits
@@ -0,0 +1,58 @@
+import random
+
+
+class AdaptiveOperatorSelector:
+    """Probability-matching bandit over a set of variation operators.
+
+    Each operator's quality tracks its yield of new HUIs per fitness
+    evaluation, and its selection probability is proportional to that quality
+    with a floor of min_prob so no operator is ever starved.
+    """
+
+    def __init__(self, operators, min_prob=0.1, adaptation_rate=0.3):
+        self.operators = list(operators)
+        self.min_prob = min(min_prob, 1 / len(self.operators))
+        self.adaptation_rate = adaptation_rate
+        self.quality = {name: 0.0 for name in self.operators}
+        self.probabilities = {name: 1 / len(self.operators) for name in self.operators}
+        self.window_evaluations = {name: 0 for name in self.operators}
+        self.window_rewards = {name: 0 for name in self.operators}
+        self.total_evaluations = {name: 0 for name in self.operators}
+        self.total_rewards = {name: 0 for name in self.operators}
+
+    def select(self):
+        """Pick an operator name according to the current probabilities."""
+        weights = [self.probabilities[name] for name in self.operators]
+        return random.choices(self.operators, weights=weights, k=1)[0]
+
+    def record(self, name, reward):
+        """Record one fitness evaluation of a child produced by an operator."""
+        self.window_evaluations[name] += 1
+        self.window_rewards[name] += reward
+        self.total_evaluations[name] += 1
+        self.total_rewards[name] += reward
+
+    def update(self):
+        """Fold the rewards collected since the last update into the probabilities."""
+        for name in self.operators:
+            evaluations = self.window_evaluations[name]
+            if evaluations:
+                reward = self.window_rewards[name] / evaluations
+                self.quality[name] += self.adaptation_rate * (reward - self.quality[name])
+            self.window_evaluations[name] = 0
+            self.window_rewards[name] = 0
+
+        total_quality = sum(self.quality.values())
+        for name in self.operators:
+            if total_quality == 0:
+                self.probabilities[name] = 1 / len(self.operators)
+            else:
+                share = self.quality[name] / total_quality
+                self.probabilities[name] = self.min_prob + (1 - len(self.operators) * self.min_prob) * share
+
+    def summary(self):
+        """Per-operator (probability, evaluations, new HUIs) for reporting."""
+        return {
+            name: (self.probabilities[name], self.total_evaluations[name], self.total_rewards[name])
+            for name in self.operators
+        }
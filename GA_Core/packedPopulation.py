@@ -0,0 +1,104 @@
+import numpy as np
+from bitarray import bitarray
+
+from baseClass import Individual
+
+
+def pack_rows(rows, length):
+    """Pack a (rows x length) 0/1 matrix into (rows x ceil(length / 64)) uint64 words."""
+    width = (length + 63) // 64
+    packed = np.zeros((len(rows), width * 8), dtype=np.uint8)
+    if len(rows):
+        bytes_used = (length + 7) // 8
+        packed[:, :bytes_used] = np.packbits(rows, axis=1)[:, :bytes_used]
+    return packed.view(np.uint64)
+
+
+class PackedPopulation:
+    """A population as one contiguous uint64 matrix plus a parallel fitness array.
+
+    Row i holds the chromosome bytes of individual i exactly as bitarray packs
+    them (big-endian bit order, zero padded to whole words), so the first
+    ceil(length / 8) bytes of a row are the key used by the fitness cache, the
+    population index and the result store. Crossover, mutation and ordering
+    then work on whole rows at once instead of on per-individual objects.
+    """
+
+    def __init__(self, words, fitness, length):
+        self.words = words
+        self.fitness = fitness
+        self.length = length
+
+    @classmethod
+    def empty(cls, length):
+        return cls(np.zeros((0, (length + 63) // 64), dtype=np.uint64), np.zeros(0, dtype=np.int64), length)
+
+    @classmethod
+    def from_bitarrays(cls, chromosomes, length, fitness=None):
+        width = (length + 63) // 64 * 8
+        buffer = bytearray(b"".join(bits.tobytes().ljust(width, b"\0") for bits in chromosomes))
+        words = np.frombuffer(buffer, dtype=np.uint64).reshape(len(chromosomes), width // 8)
+        fitness = np.zeros(len(chromosomes), dtype=np.int64) if fitness is None else np.asarray(fitness, dtype=np.int64)
+        return cls(words, fitness, length)
+
+    @classmethod
+    def from_individuals(cls, individuals, length):
+        return cls.from_bitarrays([individual.bits for individual in individuals], length,
+                                  [individual.fitness for individual in individuals])
+
+    def __len__(self):
+        return len(self.words)
+
+    def row_bytes(self):
+        """(rows x ceil(length / 8)) byte view of the chromosomes."""
+        return self.words.view(np.uint8)[:, :(self.length + 7) // 8]
+
+    def keys(self):
+        """Per-row chromosome keys, equal to bits.tobytes() of the matching bitarray."""
+        return [row.tobytes() for row in self.row_bytes()]
+
+    def to_matrix(self):
+        """Unpack into a (rows x length) 0/1 matrix for the batched fitness engines."""
+        return np.unpackbits(self.row_bytes(), axis=1)[:, :self.length]
+
+    def to_bitarrays(self):
+        chromosomes = []
+        for key in self.keys():
+            bits = bitarray()
+            bits.frombytes(key)
+            del bits[self.length:]
+            chromosomes.append(bits)
+        return chromosomes
+
+    def to_individuals(self):
+        return [Individual(bits, int(fitness)) for bits, fitness in zip(self.to_bitarrays(), self.fitness)]
+
+    def take(self, indexes):
+        return PackedPopulation(self.words[indexes], self.fitness[indexes], self.length)
+
+    def concat(self, other):
+        return PackedPopulation(np.vstack((self.words, other.words)), np.concatenate((self.fitness, other.fitness)), self.length)
+
+    def fitness_order(self):
+        """Row indexes sorted by fitness, best first; ties keep their current order."""
+        return np.argsort(-self.fitness, kind="stable")
+
+    def crossover(self, first, second, masks):
+        """Children of the row pairs (first[i], second[i]) under packed masks[i].
+
+        The first half of the result are the (p1 & ~m) | (p2 & m) children and
+        the second half their (p2 & ~m) | (p1 & m) siblings.
+        """
+        parent_1 = self.words[first]
+        parent_2 = self.words[second]
+        inverse = ~masks
+        children = np.vstack(((parent_1 & inverse) | (parent_2 & masks), (parent_2 & inverse) | (parent_1 & masks)))
+        return PackedPopulation(children, np.zeros(len(children), dtype=np.int64), self.length)
+
+    def mutants(self, rows, positions):
+        """Copies of the given rows with one bit flipped each."""
+        words = self.words[rows]
+        flips = np.zeros((len(words), words.shape[1] * 8), dtype=np.uint8)
+        flips[np.arange(len(words)), positions // 8] = 128 >> (positions % 8)
+        words ^= flips.view(np.uint64)
+        return PackedPopulation(words, np.zeros(len(words), dtype=np.int64), self.length)
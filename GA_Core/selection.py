@@ -0,0 +1,112 @@
+import random
+import numpy as np
+
+
+class AliasTable:
+    """Walker alias table: O(n) to build, O(1) per weighted draw."""
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = sum(weights)
+        self.size = n
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        if n == 0 or total <= 0:
+            return
+
+        scaled = [weight * n / total for weight in weights]
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+
+    def sample(self):
+        i = random.randrange(self.size)
+        return i if random.random() < self.prob[i] else self.alias[i]
+
+
+class SelectionTable:
+    """Selection state built once per generation from the current population."""
+
+    def __init__(self, population):
+        self.ranked = sorted(population, key=lambda x: x.fitness, reverse=True)
+        n = len(self.ranked)
+        self.roulette_table = AliasTable([individual.fitness for individual in self.ranked])
+        self.rank_table = AliasTable([n - rank for rank in range(n)])
+        self.strategies = (self.tournament, self.roulette_wheel, self.rank)
+
+    def tournament(self):
+        """Best of a random-size tournament, drawn with replacement.
+
+        The winner's rank is the minimum of k uniform ranks, which is sampled
+        directly by inverting the CDF of the minimum of k uniforms.
+        """
+        n = len(self.ranked)
+        k = random.randint(1, n)
+        rank = int((1.0 - (1.0 - random.random()) ** (1.0 / k)) * n)
+        return self.ranked[min(rank, n - 1)]
+
+    def roulette_wheel(self):
+        """Fitness-proportionate draw (uniform when every fitness is 0)."""
+        return self.ranked[self.roulette_table.sample()]
+
+    def rank(self):
+        """Draw weighted linearly by rank, best first."""
+        return self.ranked[self.rank_table.sample()]
+
+    def select(self):
+        """Run one randomly chosen strategy."""
+        return random.choice(self.strategies)()
+
+
+class ArraySelection:
+    """The SelectionTable strategies vectorized over a fitness array sorted best first."""
+
+    def __init__(self, fitness):
+        self.size = len(fitness)
+        total = fitness.sum()
+        self.roulette_weights = fitness / total if total > 0 else None
+        ranks = np.arange(self.size, 0, -1, dtype=np.float64)
+        self.rank_weights = ranks / ranks.sum()
+
+    def tournament(self, rng, count):
+        k = rng.integers(1, self.size + 1, size=count)
+        ranks = ((1.0 - (1.0 - rng.random(count)) ** (1.0 / k)) * self.size).astype(np.int64)
+        return np.minimum(ranks, self.size - 1)
+
+    def roulette_wheel(self, rng, count):
+        if self.roulette_weights is None:
+            return rng.integers(self.size, size=count)
+        return rng.choice(self.size, size=count, p=self.roulette_weights)
+
+    def rank(self, rng, count):
+        return rng.choice(self.size, size=count, p=self.rank_weights)
+
+    def select(self, rng, count):
+        """count row indexes, each drawn by a randomly chosen strategy."""
+        strategies = rng.integers(3, size=count)
+        selected = np.empty(count, dtype=np.int64)
+        for i, draw in enumerate((self.tournament, self.roulette_wheel, self.rank)):
+            chosen = strategies == i
+            selected[chosen] = draw(rng, int(chosen.sum()))
+        return selected
+
+    def select_pairs(self, rng, count):
+        """count pairs of row indexes, distinct unless there are fewer than two rows."""
+        first = self.select(rng, count)
+        second = self.select(rng, count)
+        if self.size < 2:
+            return first, second
+        same = first == second
+        while same.any():
+            second[same] = self.select(rng, int(same.sum()))
+            same = first == second
+        return first, second
@@ -0,0 +1,72 @@
+import random
+import numpy as np
+from bitarray import bitarray
+
+from selection import AliasTable
+
+
+class TransactionSampler:
+    """Draws itemsets from real transactions and repairs unsupported ones.
+
+    seed() takes a random non-empty subset of a transaction drawn with
+    probability proportional to its transaction utility, so every seed occurs
+    in at least one transaction. repair() projects an itemset that no
+    transaction contains onto a random transaction sharing one of its items.
+    """
+
+    def __init__(self, transactions, length):
+        self.transactions = transactions
+        self.length = length
+        self.item_offsets, self.item_tids, _ = transactions.vertical_index()
+        weights = np.asarray(transactions.transaction_utilities, dtype=np.float64) * (transactions.row_lengths() > 0)
+        self.table = AliasTable(weights.tolist())
+
+    def item_tids_of(self, pos):
+        item = pos + 1
+        if item + 1 >= len(self.item_offsets):
+            return self.item_tids[:0]
+        return self.item_tids[self.item_offsets[item]:self.item_offsets[item + 1]]
+
+    def project(self, tid, positions=None):
+        """Bits of transaction tid, restricted to positions when given."""
+        items = self.transactions.row(tid)[0]
+        bits = bitarray(self.length)
+        bits.setall(0)
+        for item in items.tolist():
+            if positions is None or item - 1 in positions:
+                bits[item - 1] = 1
+        return bits
+
+    def seed(self):
+        """A random non-empty subset of a transaction drawn by transaction utility."""
+        if not self.table.size:
+            return None
+        items = self.transactions.row(self.table.sample())[0].tolist()
+        if not items:
+            return None
+        bits = bitarray(self.length)
+        bits.setall(0)
+        for item in random.sample(items, random.randint(1, len(items))):
+            bits[item - 1] = 1
+        return bits
+
+    def supported(self, positions):
+        """Whether some transaction contains all the given bit positions."""
+        tids = None
+        for pos in sorted(positions, key=lambda pos: len(self.item_tids_of(pos))):
+            item_tids = self.item_tids_of(pos)
+            tids = item_tids if tids is None else np.intersect1d(tids, item_tids, assume_unique=True)
+            if not len(tids):
+                return False
+        return True
+
+    def repair(self, bits):
+        """The itemset itself if supported, else its projection onto a random transaction sharing an item."""
+        positions = list(bits.search(1))
+        if not positions or self.supported(positions):
+            return bits
+        candidates = [pos for pos in positions if len(self.item_tids_of(pos))]
+        if not candidates:
+            return bits
+        item_tids = self.item_tids_of(random.choice(candidates))
+        return self.project(int(item_tids[random.randrange(len(item_tids))]), set(positions))
@@ -0,0 +1,57 @@
+import numpy as np
+
+
+class UpperBoundScreen:
+    """Cheap bounds that reject candidates before an exact fitness evaluation.
+
+    An itemset's utility is at most the TWU of any of its items and of any pair
+    of its items (the summed utility of the transactions containing both), and
+    it is exactly 0 when one item never occurs or two items never co-occur.
+    screen() returns 0 for candidates these bounds prove are not HUIs, and None
+    for those that need the exact scan. The pairwise table takes k^2 int64s,
+    so it is only built for up to max_pair_items items.
+    """
+
+    def __init__(self, transactions, length, min_utility, max_pair_items=2048, pair_chunk=1 << 22):
+        self.min_utility = min_utility
+        items, _, offsets = transactions.entries()
+        positions = np.asarray(items, dtype=np.int64) - 1
+        self.support = np.bincount(positions, minlength=length)[:length]
+        self.item_twu = transactions.item_twu()[1:length + 1]
+        self.item_twu = np.pad(self.item_twu, (0, length - len(self.item_twu)))
+        self.pair_twu = None
+        if length <= max_pair_items:
+            self.pair_twu = self.build_pair_twu(positions, offsets, transactions.transaction_utilities, length, pair_chunk)
+
+    def build_pair_twu(self, positions, offsets, transaction_utilities, length, pair_chunk):
+        """k x k table of the TWU of every item pair, accumulated pair_chunk pairs at a time."""
+        pair_twu = np.zeros(length * length, dtype=np.float64)
+        pairs = []
+        weights = []
+        pending = 0
+        for tid, tu in enumerate(np.asarray(transaction_utilities, dtype=np.float64).tolist()):
+            row = positions[offsets[tid]:offsets[tid + 1]]
+            pairs.append((row[:, None] * length + row[None, :]).ravel())
+            weights.append(np.full(len(row) * len(row), tu))
+            pending += len(row) * len(row)
+            if pending >= pair_chunk:
+                pair_twu += np.bincount(np.concatenate(pairs), weights=np.concatenate(weights), minlength=length * length)
+                pairs, weights, pending = [], [], 0
+        if pairs:
+            pair_twu += np.bincount(np.concatenate(pairs), weights=np.concatenate(weights), minlength=length * length)
+        return np.rint(pair_twu).astype(np.int64).reshape(length, length)
+
+    def screen(self, Individual_bits):
+        """0 if the bounds rule the itemset out as a HUI, None if it needs an exact evaluation."""
+        positions = np.fromiter(Individual_bits.search(1), dtype=np.int64)
+        if not len(positions) or (self.support[positions] == 0).any():
+            return 0
+        bound = self.item_twu[positions].min()
+        if self.pair_twu is not None and len(positions) > 1:
+            pair_bounds = self.pair_twu[np.ix_(positions, positions)]
+            if (pair_bounds == 0).any():
+                return 0
+            bound = min(bound, pair_bounds.min())
+        if bound < self.min_utility:
+            return 0
+        return None
@@ -0,0 +1,189 @@
+import itertools
+import os
+import queue
+import random
+import sys
+import time
+import multiprocessing as cpu
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from ga import GeneticAlgorithm
+from resultStore import ResultStore
+
+# How often an island waiting for migrants checks whether any island is still evolving
+MIGRATION_POLL_SECONDS = 0.1
+# How often the parent, waiting for island results, checks whether the islands are still alive
+RESULT_POLL_SECONDS = 1.0
+
+
+def island_destination(island_id, num_islands, topology, seed, epoch):
+    """Island that island_id sends its emigrants to in a migration epoch.
+
+    The random topology draws one shift per epoch from the shared seed, so
+    every island computes the same permutation and receives exactly once.
+    """
+    if topology == "ring":
+        shift = 1
+    else:
+        shift = random.Random(seed * 1000003 + epoch).randint(1, num_islands - 1)
+    return (island_id + shift) % num_islands
+
+
+def receive_migrants(inbox, finished, failed, num_islands):
+    """Wait for this epoch's migrants; None once every island has stopped evolving or one has failed."""
+    while True:
+        try:
+            return inbox.get(timeout=MIGRATION_POLL_SECONDS)
+        except queue.Empty:
+            if failed.is_set() or finished.value == num_islands:
+                return None
+
+
+def run_island(island_id, num_islands, ga_args, ga_options, seed, migration_interval, migrants, topology, inboxes, results, finished, failed):
+    """Evolve one island and report its HUIs and peak memory; runs in its own process.
+
+    An island stops evolving on the same criteria as a single GA run. It then
+    keeps exchanging its best individuals at each migration until every island
+    has stopped, so no neighbour waits on it. An island that fails sets failed,
+    and the others carry on without migration.
+    """
+    random.seed(seed + island_id)
+    ga = GeneticAlgorithm(*ga_args, **ga_options)
+    stopped = False
+    try:
+        ga.run_start = time.time()
+        ga.memory_tracker.start()
+        ga.load_transactions()
+        ga.generate_initial_population()
+        for generation in itertools.count():
+            if not stopped:
+                if ga.generations is not None and generation >= ga.generations:
+                    ga.stop_reason = "generations"
+                else:
+                    ga.stop_reason = ga.stopping_criterion() or (None if len(ga.population) >= 2 else "population")
+                stopped = ga.stop_reason is not None
+                if stopped:
+                    with finished.get_lock():
+                        finished.value += 1
+            if stopped and (finished.value == num_islands or failed.is_set()):
+                break
+            if not stopped:
+                start_time = time.time()
+                ga.evolve_generation()
+                ga.total_time += time.time() - start_time
+            if num_islands > 1 and not failed.is_set() and (generation + 1) % migration_interval == 0:
+                epoch = (generation + 1) // migration_interval
+                destination = island_destination(island_id, num_islands, topology, seed, epoch)
+                inboxes[destination].put(ga.emigrants(migrants))
+                incoming = receive_migrants(inboxes[island_id], finished, failed, num_islands)
+                if incoming is not None:
+                    ga.accept_migrants(incoming)
+                elif stopped:
+                    break
+        ga.memory_tracker.stop()
+        results.put((island_id, ga.hui_sets.packed_items(), ga.item_ids, ga.total_time, ga.memory_tracker.peak_rss, None))
+    except Exception as e:
+        failed.set()
+        if not stopped:
+            with finished.get_lock():
+                finished.value += 1
+        ga.memory_tracker.stop()
+        results.put((island_id, [], [], ga.total_time, ga.memory_tracker.peak_rss, str(e)))
+    finally:
+        ga.shutdown()
+
+
+class IslandModel:
+    def __init__(self, dataset_path, min_utility, population_size, generations, crossover_prob, mutation_prob, output, islands=None, migration_interval=5, migrants=2, topology="ring", **ga_options):
+        if topology not in ("ring", "random"):
+            raise ValueError(f"Unknown topology: {topology}")
+        if migration_interval < 1:
+            raise ValueError("migration_interval must be at least 1")
+        self.dataset_path = dataset_path
+        self.min_utility = min_utility
+        self.output = output
+        self.islands = islands if islands else cpu.cpu_count()
+        self.migration_interval = migration_interval
+        self.migrants = migrants
+        self.topology = topology
+        # Islands already run one per process, so each scores its own individuals inline
+        ga_options.setdefault("executor", "serial")
+        ga_options.setdefault("num_workers", 1)
+        self.ga_args = (dataset_path, min_utility, population_size, generations, crossover_prob, mutation_prob, os.devnull)
+        self.ga_options = ga_options
+        self.output_order = ga_options.get("output_order")
+        self.hui_sets = ResultStore()
+        self.island_times = {}
+        self.island_memory = {}
+        self.total_time = 0
+        self.total_memory = 0
+
+    def evolve(self):
+        """Run all islands in parallel and merge their HUIs."""
+        print(f"* Evolving {self.islands} islands ({self.topology} migration every {self.migration_interval} generations)...")
+        start_time = time.time()
+        seed = random.getrandbits(32)
+        inboxes = [cpu.Queue() for _ in range(self.islands)]
+        results = cpu.Queue()
+        finished = cpu.Value("i", 0)
+        failed = cpu.Event()
+        processes = [
+            cpu.Process(target=run_island, args=(island_id, self.islands, self.ga_args, self.ga_options, seed,
+                                                  self.migration_interval, self.migrants, self.topology, inboxes, results, finished, failed))
+            for island_id in range(self.islands)
+        ]
+        for process in processes:
+            process.start()
+        pending = set(range(self.islands))
+        while pending:
+            try:
+                island_id, hui_sets, item_ids, island_time, island_memory, error = results.get(timeout=RESULT_POLL_SECONDS)
+            except queue.Empty:
+                # An island killed outright never reports: the others stop migrating, and
+                # the parent gives up on it once none is left running
+                if results.empty() and any(not processes[island_id].is_alive() for island_id in pending):
+                    failed.set()
+                if not any(process.is_alive() for process in processes) and results.empty():
+                    print(f"Islands {sorted(pending)} stopped without reporting results.")
+                    break
+                continue
+            pending.discard(island_id)
+            if error:
+                print(f"An error occurred on island {island_id}: {error}")
+            if item_ids and not self.hui_sets.item_ids:
+                self.hui_sets.item_ids = item_ids
+            self.hui_sets.update(hui_sets)
+            self.island_times[island_id] = island_time
+            self.island_memory[island_id] = island_memory
+        for process in processes:
+            process.join()
+        self.total_time = time.time() - start_time
+
+    def report_performance(self):
+        """Report performance metrics."""
+        # Each island peaks in its own process, so the run's footprint is the sum of their peaks
+        self.total_memory = sum(self.island_memory.values())
+        print(f"* Report performance for database: {os.path.splitext(os.path.basename(self.dataset_path))[0]}")
+        print(f"\t> Total High-utility item-sets found: {len(self.hui_sets)}")
+        print(f"\t> Total time: ~ {self.total_time:.3f} s")
+        print(f"\t> Total memory used by islands: ~ {self.total_memory / 1024 / 1024:.3f} MB")
+        for island_id, island_time in sorted(self.island_times.items()):
+            print(f"\t> Island {island_id}: ~ {island_time:.3f} s, peak memory ~ {self.island_memory[island_id] / 1024 / 1024:.3f} MB")
+
+    def save_files(self):
+        """Save the merged results to an output file."""
+        with open(self.output, "w") as file:
+            file.write(f'Genetic Algorithm Result For Database: {os.path.splitext(os.path.basename(self.dataset_path))[0]} \n')
+            file.write(f'Total time: {self.total_time:.3f} s\n')
+            file.write(f'Total memory used by islands: ~ {self.total_memory / 1024 / 1024:.3f} MB\n')
+            file.write(f"Total High-utility item-sets found: {len(self.hui_sets)}\n\n")
+            self.hui_sets.write(file, self.output_order, self.min_utility)
+
+    def execute(self):
+        """Execute the island-model genetic algorithm."""
+        try:
+            self.evolve()
+            self.report_performance()
+            self.save_files()
+        except Exception as e:
+            print(f"An error occurred during the execution of the island model: {e}")
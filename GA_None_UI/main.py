@@ -1,4 +1,5 @@
 from ga import GeneticAlgorithm
+from islandModel import IslandModel
 
 if __name__ == '__main__':
     dataset_path = 'Dataset/smallDB.txt'
@@ -8,6 +9,11 @@ if __name__ == '__main__':
     mutation_prob = 0.2
     min_utility = 10
     output = "output.txt"
+    fitness_engine = "vertical"
+    islands = 1
 
-    ga = GeneticAlgorithm(dataset_path, min_utility, population_size, generations, crossover_prob, mutation_prob, output)
+    if islands > 1:
+        ga = IslandModel(dataset_path, min_utility, population_size, generations, crossover_prob, mutation_prob, output, islands, fitness_engine=fitness_engine)
+    else:
+        ga = GeneticAlgorithm(dataset_path, min_utility, population_size, generations, crossover_prob, mutation_prob, output, fitness_engine)
     ga.execute()
\ No newline at end of file
@@ -16,12 +16,17 @@ from PyQt6.QtWidgets import (
     QSplitter,
     QProgressDialog,
     QGroupBox,
+    QTableView,
+    QHeaderView,
 )
 from PyQt6.QtGui import QFont, QKeySequence
 from PyQt6.QtCore import Qt
 
 from worker import Worker
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from resultTableModel import ResultTableModel
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -198,11 +203,24 @@ class MainWindow(QMainWindow):
         param_and_running_splitter.addWidget(self.running_info_textbox)
         param_and_running_splitter.setSizes([self.width() // 2, self.width() // 2])
 
-        # Output display
-        self.output_textbox = QTextEdit()
-        self.output_textbox.setPlaceholderText("Output Information")
-        self.output_textbox.setFont(QFont("Courier", 10))
-        splitter.addWidget(self.output_textbox)
+        # Output display: a virtual table over the run's result store, filled as HUIs stream in
+        output_widget = QWidget()
+        output_layout = QVBoxLayout(output_widget)
+        output_layout.setContentsMargins(0, 0, 0, 0)
+        self.output_summary_label = QLabel("Output Information")
+        output_layout.addWidget(self.output_summary_label)
+        self.result_model = ResultTableModel(parent=self)
+        self.output_table = QTableView()
+        self.output_table.setModel(self.result_model)
+        self.output_table.setFont(QFont("Courier", 10))
+        self.output_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.output_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.output_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.output_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.output_table.horizontalHeader().setSortIndicator(0, Qt.SortOrder.AscendingOrder)
+        self.output_table.setSortingEnabled(True)
+        output_layout.addWidget(self.output_table)
+        splitter.addWidget(output_widget)
 
         self.dataset_path = ""
         self.min_utility_textbox.setFocus()
@@ -252,6 +270,8 @@ class MainWindow(QMainWindow):
             #Call Worker
             self.worker = Worker(self.dataset_path, min_utility, generations, population_size, crossover_prob, mutation_prob)
             self.worker.progress_update.connect(self.update_progress_dialog)
+            self.worker.results_updated.connect(self.update_results)
+            self.result_model.set_store(self.worker.ga.hui_sets, min_utility)
             self.worker.finished.connect(self.genetic_algorithm_finished)
             self.worker.start()
 
@@ -268,11 +288,14 @@ class MainWindow(QMainWindow):
     def cancel_algorithm(self):
         if hasattr(self, "worker") and isinstance(self.worker, Worker):
             self.worker.finished.disconnect(self.genetic_algorithm_finished)
-            self.display_output(self.worker.ga)
             self.worker.cancel_execution()
+            self.worker.wait()
+            self.display_output(self.worker.ga)
 
     def genetic_algorithm_finished(self, result):
         if isinstance(result, Exception):
+            # The HUIs the child streamed before it failed stay on display
+            self.display_output(self.worker.ga)
             QMessageBox.critical(self, "Error", f"An error occurred: {str(result)}")
         else:
             ga = result
@@ -286,17 +309,19 @@ class MainWindow(QMainWindow):
         self.progress_dialog.setLabelText(text)
         self.running_info_textbox.append(text)
 
+    def update_results(self):
+        self.result_model.refresh()
+        self.output_summary_label.setText(f"High-utility item-sets found so far: {self.result_model.rowCount()}")
+
     def display_output(self, ga):
-        output_text = f"Total High-utility item-sets found: {len(ga.hui_sets)}\n--------------------------------------\n"
-        for bits, fitness in ga.hui_sets:
-            if fitness >= int(self.min_utility_textbox.text()):
-                items = [i + 1 for i in range(len(bits)) if bits[i]]
-                items_str = " ".join(map(str, items))
-                output_text += f"{items_str} #UTIL: {fitness}\n"
-        self.output_textbox.setText(output_text)
+        if self.result_model.store is ga.hui_sets:
+            self.result_model.refresh()
+        else:
+            self.result_model.set_store(ga.hui_sets, ga.min_utility)
+        self.output_summary_label.setText(f"Total High-utility item-sets found: {self.result_model.rowCount()}")
+
     def save_output_to_file(self):
-        output_text = self.output_textbox.toPlainText()
-        if output_text:
+        if self.result_model.rowCount():
             file_dialog = QFileDialog()
             output_path, _ = file_dialog.getSaveFileName(
                 self, "Save Output As", "", "Text Files (*.txt)"
@@ -315,7 +340,8 @@ class MainWindow(QMainWindow):
             self.generations_textbox.clear()
             self.crossover_prob_textbox.clear()
             self.mutation_prob_textbox.clear()
-            self.output_textbox.clear()
+            self.result_model.clear()
+            self.output_summary_label.setText("Output Information")
             self.running_info_textbox.clear()
             self.dataset_path = ""
             self.file_path_label.clear()
@@ -1,32 +1,140 @@
+import os
+import sys
+import pickle
+import subprocess
+import threading
 from PyQt6.QtCore import QThread, pyqtSignal
-from gaForUI import GeneticAlgorithm
+
+GA_CORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "GA_Core")
+sys.path.append(GA_CORE_PATH)
+from gaProcess import GAResult
+
+STAGES = {
+    "load": ("* Loading Transactions...", "Loaded Successful in: ~ {seconds:.3f} s"),
+    "init": ("* Generating Initial Population...", "Generated Population in ~ {seconds:.3f} s"),
+    "evolve": ("* Evolving Population...", None),
+}
+# How long a cancelled run that saves checkpoints gets to save one and stop before it is killed
+CANCEL_GRACE_SECONDS = 5.0
 
 
 class Worker(QThread):
+    """Runs the GA in a child process and relays what it streams back.
+
+    The GA no longer competes with the UI for this process's GIL, and
+    cancelling kills the child at once, unless the run saves checkpoints: the
+    child is then asked to cancel, saves a checkpoint and stops, and is killed
+    only if it has not within CANCEL_GRACE_SECONDS. self.ga keeps the last
+    population and HUIs it reported, and results_updated fires each time it
+    gains some.
+    finished carries self.ga after a completed run and an Exception when the
+    child failed or stopped before finishing.
+    """
     progress_update = pyqtSignal(str)
+    result_message = pyqtSignal(object)
+    results_updated = pyqtSignal()
     finished = pyqtSignal(object)
 
-    def __init__(self, dataset_path, min_utility, generations, population_size, crossover_prob, mutation_prob):
+    def __init__(self, dataset_path, min_utility, generations, population_size, crossover_prob, mutation_prob, **ga_options):
         super().__init__()
-        self.ga = GeneticAlgorithm(dataset_path, min_utility, generations, population_size, crossover_prob,mutation_prob)
+        self.ga_args = (dataset_path, min_utility, population_size, generations, crossover_prob, mutation_prob)
+        self.ga_options = ga_options
+        self.ga = GAResult(dataset_path, min_utility, ga_options.get("output_order"))
+        self.process = None
+        # Serializes writes to the child's stdin: its arguments, then any cancel message
+        self.stdin_lock = threading.Lock()
         self.cancel_requested = False
+        # Queued to the thread that owns this object, so self.ga only changes under the UI's feet there
+        self.result_message.connect(self.apply_result)
+
+    def apply_result(self, message):
+        """Fold a streamed result message into self.ga and tell the UI it grew."""
+        self.ga.update(message)
+        self.results_updated.emit()
+
+    def handle_event(self, event, details):
+        """Turn an engine progress event into a progress_update signal."""
+        if event == "stage":
+            self.progress_update.emit(STAGES[details["name"]][0])
+        elif event == "stage_done" and STAGES[details["name"]][1]:
+            self.progress_update.emit(STAGES[details["name"]][1].format(**details))
+        elif event == "generation":
+            self.progress_update.emit(f"Evolving Generation {details['number']} in ~ {details['seconds']:.3f} s")
+        elif event == "resumed":
+            self.progress_update.emit(f"Resumed after generation {details['generation']}")
+        elif event == "report":
+            self.progress_update.emit(f"\nReport performance for database: {details['dataset']}")
+            for line in details["lines"]:
+                self.progress_update.emit(line)
+        elif event == "error":
+            self.progress_update.emit(details["message"])
+        elif event == "cancelled":
+            self.progress_update.emit("\nAlgorithm execution has been canceled.")
 
     def run(self):
         try:
-            self.ga.progress_update.connect(self.progress_update.emit)
-            self.ga.execute()
+            # A fresh interpreter running gaProcess.py as a script: forking a process with running
+            # Qt threads is unsafe, and multiprocessing's spawn would re-import this Qt program
+            self.process = subprocess.Popen([sys.executable, os.path.join(GA_CORE_PATH, "gaProcess.py")],
+                                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            with self.stdin_lock:
+                pickle.dump((self.ga_args, self.ga_options), self.process.stdin)
+                self.process.stdin.flush()
+            if self.cancel_requested:
+                self.stop_process()
+            completed = False
+            while True:
+                try:
+                    message = pickle.load(self.process.stdout)
+                except (EOFError, pickle.UnpicklingError, OSError):
+                    break
+                if message[0] == "event":
+                    self.handle_event(message[1], message[2])
+                else:
+                    completed = message[0] == "finished"
+                    self.result_message.emit(message)
+            self.process.wait()
+            with self.stdin_lock:
+                self.process.stdin.close()
             if self.cancel_requested:
                 self.finished.emit(None)
                 self.reset_status()
-            else:
+            elif completed:
                 self.finished.emit(self.ga)
+            else:
+                message = f"The genetic algorithm process stopped unexpectedly (exit code {self.process.returncode})."
+                self.progress_update.emit(message)
+                self.finished.emit(RuntimeError(message))
         except Exception as e:
-            self.finished.emit(None)
+            self.progress_update.emit(f"An error occurred while running the genetic algorithm process: {e}")
+            self.finished.emit(e)
 
     def cancel_execution(self):
+        """Stop the GA process; the population and HUIs it last reported stay in self.ga."""
         self.cancel_requested = True
-        self.ga.cancel_requested = True
+        self.stop_process()
+
+    def stop_process(self):
+        """Ask a checkpointing GA process to cancel, with a deadline, and terminate any other at once."""
+        with self.stdin_lock:
+            if self.process is None or self.process.poll() is not None:
+                return
+            if self.ga_options.get("checkpoint_path"):
+                try:
+                    pickle.dump("cancel", self.process.stdin)
+                    self.process.stdin.flush()
+                except (OSError, ValueError):
+                    pass
+                else:
+                    timer = threading.Timer(CANCEL_GRACE_SECONDS, self.terminate_process)
+                    timer.daemon = True
+                    timer.start()
+                    return
+            self.process.terminate()
+
+    def terminate_process(self):
+        if self.process.poll() is None:
+            self.process.terminate()
 
     def reset_status(self):
         self.cancel_requested = False
-        
\ No newline at end of file
@@ -1,8 +1,13 @@
 import time
-import csv
-import psutil
 from collections import defaultdict
 import bisect
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from transactionStore import TransactionStore
+from metrics import Metrics
+from memoryTracker import MemoryTracker
 
 class Element:
     def __init__(self, tid, iutils, rutils):
@@ -23,18 +28,21 @@ class UtilityList:
         self.elements.append(element)
 
 class HUIMiner:
-    def __init__(self):
+    def __init__(self, traceMemory=False):
         self.startTimestamp = 0
         self.endTimestamp = 0
         self.huiCount = 0
         self.mapItemToTWU = {}
         self.joinCount = 0
+        self.prunedCount = 0
+        self.metrics = Metrics("huiminer")
+        self.traceMemory = traceMemory
+        self.memoryTracker = MemoryTracker(trace=traceMemory)
         self.BUFFERS_SIZE = 200
         self.itemsetBuffer = [0] * self.BUFFERS_SIZE
 
     def runAlgorithm(self, inputPath, outputPath, minUtility):
         self.startTimestamp = time.time()
-        self.startMemory = psutil.Process().memory_info().rss / (1024 * 1024)  # Memory in MB
         self.itemsetBuffer = [0] * self.BUFFERS_SIZE
 
         with open(outputPath, 'w') as writer:
@@ -42,25 +50,28 @@ class HUIMiner:
 
             self.mapItemToTWU = defaultdict(int)
 
-            transactions = self.readTransactions(inputPath)
-            self.calculateTWU(transactions, minUtility)
-            listOfUtilityLists, mapItemToUtilityList = self.createUtilityLists(minUtility)
-            self.buildUtilityLists(transactions, mapItemToUtilityList, minUtility)
-            self.huiMiner([], 0, None, listOfUtilityLists, minUtility)
-
+            self.huiCount = 0
+            self.joinCount = 0
+            self.prunedCount = 0
+            self.metrics = Metrics("huiminer")
+            self.memoryTracker = MemoryTracker(trace=self.traceMemory)
+            self.memoryTracker.start()
+            with self.metrics.timer("load"), self.memoryTracker.phase("load"):
+                transactions = self.readTransactions(inputPath)
+            with self.metrics.timer("twu"), self.memoryTracker.phase("twu"):
+                self.calculateTWU(transactions, minUtility)
+            with self.metrics.timer("build"), self.memoryTracker.phase("build"):
+                listOfUtilityLists, mapItemToUtilityList = self.createUtilityLists(minUtility)
+                self.buildUtilityLists(transactions, mapItemToUtilityList, minUtility)
+            with self.metrics.timer("search"), self.memoryTracker.phase("search"):
+                self.huiMiner([], 0, None, listOfUtilityLists, minUtility)
+
+            self.memoryTracker.stop()
             self.endTimestamp = time.time()
-            self.endMemory = psutil.Process().memory_info().rss / (1024 * 1024)  # Memory in MB
 
     def readTransactions(self, inputPath):
-        transactions = []
-        with open(inputPath, 'r') as file:
-            reader = csv.reader(file, delimiter=':')
-            for row in reader:
-                items = list(map(int, row[0].split()))
-                transactionUtility = int(row[1])
-                utilities = list(map(int, row[2].split()))
-                transactions.append((items, transactionUtility, utilities))
-        return transactions
+        # Rows iterate as (items, transactionUtility, utilities) without per-row objects in memory
+        return TransactionStore.from_file(inputPath)
 
     def calculateTWU(self, transactions, minUtility):
         for items, transactionUtility, _ in transactions:
@@ -104,7 +115,9 @@ class HUIMiner:
             if X.sumIutils >= minUtility:
                 self.writeOut(prefix, prefixLength, X.item, X.sumIutils)
 
-            if X.sumIutils + X.sumRutils >= minUtility:
+            if X.sumIutils + X.sumRutils < minUtility:
+                self.prunedCount += 1
+            else:
                 exULs = []
                 for j in range(i + 1, len(ULs)):
                     Y = ULs[j]
@@ -138,6 +151,13 @@ class HUIMiner:
             return ulist.elements[index]
         return None
 
+    def exportMetrics(self, path):
+        """Write the phase timers and counters of the last run to path (JSON, or Prometheus text for .prom/.txt)."""
+        self.metrics.counters["joins"] = self.joinCount
+        self.metrics.counters["pruned"] = self.prunedCount
+        self.metrics.counters["huis"] = self.huiCount
+        self.metrics.export(path)
+
     def writeOut(self, prefix, prefixLength, item, utility):
         self.huiCount += 1
         output = ' '.join(map(str, prefix[:prefixLength])) + ' ' + str(item) + ' #UTIL: ' + str(utility)
@@ -151,7 +171,11 @@ class HUIMiner:
 
         print("=============  HUI-MINER ALGORITHM - STATS =============")
         print(f" Total time ~ {hours} giờ {minutes} phút {seconds:.2f} giây")
-        print(" Memory ~", self.endMemory - self.startMemory, "MB")
+        for line in self.memoryTracker.summary_lines():
+            print(f" {line}")
         print(" High-utility itemsets count :", self.huiCount)
         print(" Join count :", self.joinCount)
+        print(" Pruned count :", self.prunedCount)
+        for phase, seconds in self.metrics.timers.items():
+            print(f" Phase {phase} ~ {seconds:.3f} s")
         print("===================================================")
@@ -1,8 +1,14 @@
 import time
-import psutil
 from collections import defaultdict
 import bisect
-import csv
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from transactionStore import TransactionStore
+from metrics import Metrics
+from memoryTracker import MemoryTracker
+from resultStore import ResultStore
 
 class Element:
     def __init__(self, tid, iutils, rutils):
@@ -23,43 +29,50 @@ class UtilityList:
         self.elements.append(element)
 
 class HUIMiner:
-    def __init__(self):
+    def __init__(self, traceMemory=False):
         self.times = 0
         self.memory = 0
         self.huiCount = 0
         self.mapItemToTWU = {}
         self.joinCount = 0
+        self.prunedCount = 0
+        self.metrics = Metrics("huiminer")
+        self.traceMemory = traceMemory
+        self.memoryTracker = MemoryTracker(trace=traceMemory)
         self.BUFFERS_SIZE = 200
         self.itemsetBuffer = [0] * self.BUFFERS_SIZE
-        self.results = [] 
+        self.results = ResultStore()
 
     def runAlgorithm(self, inputPath, minUtility):
         startTime = time.time()
-        startMemory = psutil.Process().memory_info().rss
         self.itemsetBuffer = [0] * self.BUFFERS_SIZE
 
         self.mapItemToTWU = defaultdict(int)
-        self.results = []  # Clear previous results
+        self.results = ResultStore()  # Clear previous results
 
-        transactions = self.readTransactions(inputPath)
-        self.calculateTWU(transactions)
-        listOfUtilityLists, mapItemToUtilityList = self.createUtilityLists(minUtility)
-        self.buildUtilityLists(transactions, mapItemToUtilityList, minUtility)
-        self.huiMiner([], 0, None, listOfUtilityLists, minUtility)
+        self.huiCount = 0
+        self.joinCount = 0
+        self.prunedCount = 0
+        self.metrics = Metrics("huiminer")
+        self.memoryTracker = MemoryTracker(trace=self.traceMemory)
+        self.memoryTracker.start()
+        with self.metrics.timer("load"), self.memoryTracker.phase("load"):
+            transactions = self.readTransactions(inputPath)
+        with self.metrics.timer("twu"), self.memoryTracker.phase("twu"):
+            self.calculateTWU(transactions)
+        with self.metrics.timer("build"), self.memoryTracker.phase("build"):
+            listOfUtilityLists, mapItemToUtilityList = self.createUtilityLists(minUtility)
+            self.buildUtilityLists(transactions, mapItemToUtilityList, minUtility)
+        with self.metrics.timer("search"), self.memoryTracker.phase("search"):
+            self.huiMiner([], 0, None, listOfUtilityLists, minUtility)
 
         self.times = time.time()-startTime
-        self.memory = (psutil.Process().memory_info().rss - startMemory) / (1024 * 1024)  # MB
+        self.memoryTracker.stop()
+        self.memory = self.memoryTracker.peak_rss / (1024 * 1024)  # Peak RSS in MB
 
     def readTransactions(self, inputPath):
-        transactions = []
-        with open(inputPath, 'r') as file:
-            reader = csv.reader(file, delimiter=':')
-            for row in reader:
-                items = list(map(int, row[0].split()))
-                transactionUtility = int(row[1])
-                utilities = list(map(int, row[2].split()))
-                transactions.append((items, transactionUtility, utilities))
-        return transactions
+        # Rows iterate as (items, transactionUtility, utilities) without per-row objects in memory
+        return TransactionStore.from_file(inputPath)
 
     def calculateTWU(self, transactions):
         for items, transactionUtility, _ in transactions:
@@ -77,6 +90,8 @@ class HUIMiner:
                 listOfUtilityLists.append(uList)
 
         listOfUtilityLists.sort(key=lambda x: self.mapItemToTWU[x.item])
+        # Stored itemsets list their items in this processing order, as the prefixes do
+        self.results.item_ids = [uList.item for uList in listOfUtilityLists]
         return listOfUtilityLists, mapItemToUtilityList
 
     def buildUtilityLists(self, transactions, mapItemToUtilityList, minUtility):
@@ -103,7 +118,9 @@ class HUIMiner:
             if X.sumIutils >= minUtility:
                 self.storeResult(prefix, prefixLength, X.item, X.sumIutils)
 
-            if X.sumIutils + X.sumRutils >= minUtility:
+            if X.sumIutils + X.sumRutils < minUtility:
+                self.prunedCount += 1
+            else:
                 exULs = []
                 for j in range(i + 1, len(ULs)):
                     Y = ULs[j]
@@ -137,9 +154,15 @@ class HUIMiner:
             return ulist.elements[index]
         return None
 
+    def exportMetrics(self, path):
+        """Write the phase timers and counters of the last run to path (JSON, or Prometheus text for .prom/.txt)."""
+        self.metrics.counters["joins"] = self.joinCount
+        self.metrics.counters["pruned"] = self.prunedCount
+        self.metrics.counters["huis"] = self.huiCount
+        self.metrics.export(path)
+
     def storeResult(self, prefix, prefixLength, item, utility):
         self.huiCount += 1
-        result = ' '.join(map(str, prefix[:prefixLength])) + ' ' + str(item) + ' #UTIL: ' + str(utility)
-        self.results.append(result)
+        self.results.add_items(prefix[:prefixLength] + [item], utility)
 
 
@@ -1,10 +1,13 @@
+import os
 import sys
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QFormLayout, QLineEdit, QPushButton, QFileDialog, 
-                               QLabel, QTextEdit, QHBoxLayout, QMessageBox)
+                               QLabel, QTableView, QHeaderView, QHBoxLayout, QMessageBox)
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon
 from HUI_Miner_ForUI import HUIMiner  # Import HUI-Miner algorithm from the file
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Common"))
+from resultTableModel import ResultTableModel
 
 class HUI_Miner_GUI(QMainWindow):
     def __init__(self):
@@ -64,11 +67,17 @@ class HUI_Miner_GUI(QMainWindow):
         self.min_utility_input.setPlaceholderText("Enter minimum utility")
         self.form_layout.addRow(QLabel("Minimum Utility:"), self.min_utility_input)
 
-        # Text area for results
-        self.results_text = QTextEdit()
-        self.results_text.setPlaceholderText("Results will be displayed here...")
-        self.results_text.setReadOnly(True)
-        self.layout.addWidget(self.results_text)
+        # Table for results, drawn straight from the miner's result store
+        self.result_model = ResultTableModel(parent=self)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.result_model)
+        self.results_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.results_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.results_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.results_table.horizontalHeader().setSortIndicator(0, Qt.SortOrder.AscendingOrder)
+        self.results_table.setSortingEnabled(True)
+        self.layout.addWidget(self.results_table)
 
         # Status label
         self.status_label = QLabel()
@@ -77,7 +86,6 @@ class HUI_Miner_GUI(QMainWindow):
         self.layout.addWidget(self.status_label)
 
         # Initialize variables
-        self.results = ""  # To store results in memory
         self.hui_miner = HUIMiner()  # Create instance of HUIMiner
 
     def browseDataset(self):
@@ -97,28 +105,27 @@ class HUI_Miner_GUI(QMainWindow):
                 QMessageBox.warning(self, "Warning", "Min Utility can not be null.")
             self.hui_miner.runAlgorithm(dataset_file, min_utility)
             # Display results
-            
-            self.results = "\n".join(self.hui_miner.results)
-            self.results += f"\nJoin count: {self.hui_miner.joinCount} times"
-            self.results += f"\nTotal times: {self.hui_miner.times:.2f} s"
-            self.results += f"\nTotal memory: {self.hui_miner.memory:2f} MB"
-            self.results_text.setPlainText(self.results)
+            self.result_model.set_store(self.hui_miner.results)
 
             # Update status label
             elapsed_time = self.hui_miner.times
             memory_usage = self.hui_miner.memory
-            self.status_label.setText(f"Time: {elapsed_time:.2f} seconds | Memory: {memory_usage:.2f} MB")
+            self.status_label.setText(f"HUIs: {self.result_model.rowCount()} | Joins: {self.hui_miner.joinCount} | "
+                                      f"Time: {elapsed_time:.2f} seconds | Memory: {memory_usage:.2f} MB")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
     def saveResults(self):
-        if not self.results:
+        if not self.result_model.rowCount():
             QMessageBox.warning(self, "Warning", "No results to save.")
             return
         
         file_name, _ = QFileDialog.getSaveFileName(self, "Save Results", "", "Text Files (*.txt)")
         if file_name:
             with open(file_name, 'w') as file:
-                file.write(self.results)
+                self.hui_miner.results.write(file)
+                file.write(f"Join count: {self.hui_miner.joinCount} times\n")
+                file.write(f"Total times: {self.hui_miner.times:.2f} s\n")
+                file.write(f"Total memory: {self.hui_miner.memory:2f} MB")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)